@@ -36,5 +36,6 @@ class ImageTestScene(Scene):
 
 if __name__ == "__main__":
     # This allows running the script directly to render if manim is set up
-    import os
-    os.system("manim -pql Gemini3/examples/manim_image_test.py ImageTestScene")
+    import subprocess
+    import sys
+    subprocess.run([sys.executable, "-m", "manim", "-pql", __file__, "ImageTestScene"], check=False)
@@ -57,4 +57,5 @@ class ConceptWithImage(ThreeDScene):
 
 if __name__ == "__main__":
     # Render command
-    os.system("manim -pql Gemini3/examples/manual_image_concept.py ConceptWithImage")
+    import subprocess
+    subprocess.run([sys.executable, "-m", "manim", "-pql", __file__, "ConceptWithImage"], check=False)
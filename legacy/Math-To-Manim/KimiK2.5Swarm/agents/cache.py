@@ -0,0 +1,117 @@
+"""
+Completion Cache - Persistent exact-match cache for Kimi chat completions.
+
+Enrichment runs re-issue the same prompts whenever a concept tree is
+regenerated. CompletionCache keys each request on a SHA-256 of the
+model, messages, tool names and sampling settings, and stores the
+legacy response dict in a tools.cache_backends store (SQLite by default),
+so a repeated request is answered from disk without a network call.
+
+Only low-temperature requests are cached: at higher temperatures the
+caller asked for variety, and replaying one sample would defeat that.
+
+Example:
+    from agents.cache import CompletionCache
+    from agents.enrichment_chain import KimiEnrichmentPipeline
+
+    pipeline = KimiEnrichmentPipeline(cache=CompletionCache())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from tools.cache_backends import CacheBackend, SQLiteBackend
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionCache:
+    """
+    Exact-match response cache for chat_completion-style requests.
+
+    Attributes:
+        backend: Store holding serialized responses
+        max_temperature: Requests sampled above this temperature bypass
+            the cache
+        ttl: Seconds an entry stays valid (None = no expiry)
+        hits: Lookups answered from the cache
+        misses: Cacheable lookups that found nothing
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_temperature: float = 0.3,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Store for responses (defaults to
+                SQLiteBackend("~/.cache/kimi/completions.db"))
+            max_temperature: Highest temperature whose responses are cached
+            ttl: Seconds an entry stays valid (None = no expiry)
+        """
+        self.backend = backend if backend is not None else SQLiteBackend("~/.cache/kimi/completions.db")
+        self.max_temperature = max_temperature
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **_: Any,
+    ) -> Optional[str]:
+        """
+        Return the cache key for a request, or None if it must not be cached.
+
+        Tools are identified by name only; their schemas are module
+        constants.
+        """
+        if temperature is None or temperature > self.max_temperature:
+            return None
+        tool_names = [tool.get("function", {}).get("name") for tool in tools or ()]
+        material = json.dumps(
+            {
+                "model": model,
+                "system": system,
+                "messages": messages,
+                "tools": tool_names,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, if any."""
+        try:
+            payload = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Completion cache read failed: {e}")
+            payload = None
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(payload)
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Store a response; failures are logged and otherwise ignored."""
+        try:
+            self.backend.set(key, json.dumps(response).encode("utf-8"), self.ttl)
+        except Exception as e:
+            logger.warning(f"Completion cache write failed: {e}")
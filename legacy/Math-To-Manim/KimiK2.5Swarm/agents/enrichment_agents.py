@@ -148,6 +148,30 @@ def _parse_json_fallback(text: str) -> Optional[Dict[str, Any]]:
 # =============================================================================
 
 
+# Prompt text shared by every request; only the per-node lines are
+# formatted per call
+MATH_SYSTEM_PROMPT = (
+    "You are an expert mathematical physicist preparing content for a "
+    "Manim animation. Provide rigorous, properly formatted LaTeX and "
+    "clear symbol definitions. Respond by calling the tool "
+    "'write_mathematical_content'. Do not include plain text responses."
+)
+
+MATH_BATCH_SYSTEM_PROMPT = (
+    "You are an expert mathematical physicist preparing content for a "
+    "Manim animation. Provide rigorous, properly formatted LaTeX and "
+    "clear symbol definitions. Respond by calling the tool "
+    "'write_mathematical_content_batch' with one entry per concept. "
+    "Do not include plain text responses."
+)
+
+MATH_CONTENT_INSTRUCTIONS = (
+    "2-5 LaTeX equations (raw strings with escaped backslashes), "
+    "definitions for every symbol, at least one interpretation paragraph, "
+    "and any illustrative examples/typical values that help teach the idea."
+)
+
+
 class MathematicalEnricher:
     """
     Enriches knowledge nodes with mathematical content.
@@ -182,25 +206,17 @@ class MathematicalEnricher:
 
         complexity = "high school level" if node.is_foundation else "upper-undergraduate level"
 
-        system_prompt = (
-            "You are an expert mathematical physicist preparing content for a "
-            "Manim animation. Provide rigorous, properly formatted LaTeX and "
-            "clear symbol definitions. Respond by calling the tool "
-            "'write_mathematical_content'. Do not include plain text responses."
-        )
-
         user_prompt = (
             f"Concept: {node.concept}\n"
             f"Depth: {node.depth}\n"
             f"Complexity target: {complexity}\n"
-            "Return 2-5 LaTeX equations (raw strings with escaped backslashes), "
-            "definitions for every symbol, at least one interpretation paragraph, "
-            "and any illustrative examples/typical values that help teach the idea."
+            "Return " + MATH_CONTENT_INSTRUCTIONS
         )
 
-        response = self.client.chat_completion(
+        response = await asyncio.to_thread(
+            self.client.chat_completion,
             messages=[{"role": "user", "content": user_prompt}],
-            system=system_prompt,
+            system=MATH_SYSTEM_PROMPT,
             tools=[MATHEMATICAL_CONTENT_TOOL],
             tool_choice="auto",
             max_tokens=1200,
@@ -218,6 +234,91 @@ class MathematicalEnricher:
 
         return node
 
+    async def enrich_batch(
+        self,
+        nodes: List['KnowledgeNode'],
+        batch_size: int = 8,
+    ) -> List['KnowledgeNode']:
+        """
+        Enrich several nodes, asking for up to batch_size concepts per call.
+
+        Each batch shares one system prompt and tool schema instead of paying
+        for them per node. Concepts missing from a batch response are retried
+        individually with enrich_node.
+
+        Args:
+            nodes: The KnowledgeNodes to enrich
+            batch_size: Maximum concepts per request (1 = one call per node)
+
+        Returns:
+            The enriched nodes (modified in place)
+        """
+        pending: Dict[str, List['KnowledgeNode']] = {}
+        for node in nodes:
+            if node.concept in self.cache:
+                self._apply_content(node, self.cache[node.concept])
+            else:
+                pending.setdefault(node.concept, []).append(node)
+
+        groups = list(pending.values())
+        chunks = [groups[i:i + batch_size] for i in range(0, len(groups), batch_size)]
+        await asyncio.gather(*(self._enrich_chunk(chunk) for chunk in chunks))
+        return nodes
+
+    async def _enrich_chunk(self, groups: List[List['KnowledgeNode']]) -> None:
+        """Enrich one batch; each group holds the nodes sharing a concept."""
+        from tools import MATHEMATICAL_CONTENT_BATCH_TOOL
+
+        if len(groups) == 1:
+            await self.enrich_node(groups[0][0])
+        else:
+            concept_lines = []
+            for group in groups:
+                node = group[0]
+                complexity = "high school level" if node.is_foundation else "upper-undergraduate level"
+                concept_lines.append(
+                    f"- Concept: {node.concept} | Depth: {node.depth} | "
+                    f"Complexity target: {complexity}"
+                )
+            user_prompt = (
+                "Concepts:\n"
+                + "\n".join(concept_lines)
+                + "\nFor each concept, return an entry whose 'concept' is the exact name "
+                "above, with " + MATH_CONTENT_INSTRUCTIONS
+            )
+
+            response = await asyncio.to_thread(
+                self.client.chat_completion,
+                messages=[{"role": "user", "content": user_prompt}],
+                system=MATH_BATCH_SYSTEM_PROMPT,
+                tools=[MATHEMATICAL_CONTENT_BATCH_TOOL],
+                tool_choice="auto",
+                max_tokens=1200 * len(groups),
+                temperature=0.2,
+            )
+            self._tool_calls += 1
+
+            payload = _extract_tool_payload(response)
+            if payload is None:
+                payload = _parse_json_fallback(self.client.get_text_content(response))
+            entries = payload.get("entries") if isinstance(payload, dict) else payload
+            requested = {group[0].concept for group in groups}
+            for entry in entries if isinstance(entries, list) else []:
+                if isinstance(entry, dict) and entry.get("concept") in requested:
+                    self.cache[entry["concept"]] = MathematicalContent.from_payload(entry)
+
+        missing = [group for group in groups if group[0].concept not in self.cache]
+        if missing:
+            logger.warning(
+                f"Batch response omitted {len(missing)} concept(s); enriching individually"
+            )
+            await asyncio.gather(*(self.enrich_node(group[0]) for group in missing))
+
+        for group in groups:
+            content = self.cache[group[0].concept]
+            for node in group:
+                self._apply_content(node, content)
+
     def _apply_content(self, node: 'KnowledgeNode', content: MathematicalContent) -> None:
         """Apply mathematical content to a node."""
         node.equations = content.equations
@@ -18,13 +18,35 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from kimi_client import KimiClient, get_kimi_client
-
+from tools import MATHEMATICAL_CONTENT_BATCH_TOOL
+
+from .cache import CompletionCache
+from .enrichment_agents import (
+    MATH_BATCH_SYSTEM_PROMPT,
+    MATH_CONTENT_INSTRUCTIONS,
+    MATH_SYSTEM_PROMPT,
+)
+from .incremental_json import IncrementalJsonParser
 from .prerequisite_explorer_kimi import KnowledgeNode
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the latter either way
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Body of a markdown code fence, with an optional "json" language tag
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
 
 # ---------------------------------------------------------------------------
 # Shared helper utilities
@@ -49,36 +71,136 @@ def _extract_tool_payload(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if not function_call:
         return None
 
+    # Streamed responses arrive with their arguments already parsed
+    parsed = function_call.get("parsed_arguments")
+    if parsed is not None:
+        return parsed
+
     arguments = function_call.get("arguments", "")
     if not arguments:
         return None
 
     try:
-        return json.loads(arguments)
+        return _loads(arguments)
     except json.JSONDecodeError:
         return None
 
 
+async def _acollect_stream(stream: Any) -> Dict[str, Any]:
+    """Assemble a streamed completion into the legacy response dict.
+
+    Tool-call argument deltas are fed to an ``IncrementalJsonParser`` as
+    they arrive, so each payload is parsed once, when its closing brace
+    lands, and stored as ``parsed_arguments`` next to the raw string.
+    """
+    content_parts: List[str] = []
+    calls: Dict[int, Dict[str, Any]] = {}
+    parsers: Dict[int, IncrementalJsonParser] = {}
+    finish_reason = None
+
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        delta = choice.delta
+        if delta.content:
+            content_parts.append(delta.content)
+        for tool_call in delta.tool_calls or ():
+            call = calls.setdefault(
+                tool_call.index,
+                {"id": None, "type": "function", "function": {"name": "", "arguments": ""}},
+            )
+            parser = parsers.setdefault(tool_call.index, IncrementalJsonParser())
+            if tool_call.id:
+                call["id"] = tool_call.id
+            if tool_call.function is not None:
+                if tool_call.function.name:
+                    call["function"]["name"] += tool_call.function.name
+                if tool_call.function.arguments:
+                    parser.push(tool_call.function.arguments)
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+    message: Dict[str, Any] = {"role": "assistant", "content": "".join(content_parts) or None}
+    if calls:
+        for index, call in calls.items():
+            parser = parsers[index]
+            call["function"]["arguments"] = parser.text
+            parsed = parser.result()
+            if parsed is not None:
+                call["function"]["parsed_arguments"] = parsed
+        message["tool_calls"] = [calls[index] for index in sorted(calls)]
+
+    return {"choices": [{"index": 0, "message": message, "finish_reason": finish_reason}]}
+
+
+async def _achat_completion(
+    client: KimiClient,
+    cache: Optional[CompletionCache] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Await a chat completion without blocking the event loop.
+
+    Uses the client's native async method when it has one and otherwise
+    runs the blocking ``chat_completion`` in a worker thread. With a
+    cache, repeated low-temperature requests are answered from it.
+    ``stream=True`` streams from the native async method and returns the
+    assembled response; the thread fallback ignores it.
+    """
+    key = None
+    if cache is not None:
+        key = cache.key_for(getattr(client, "model", ""), **kwargs)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+    achat_completion = getattr(client, "achat_completion", None)
+    if achat_completion is not None:
+        response = await achat_completion(**kwargs)
+        if kwargs.get("stream"):
+            response = await _acollect_stream(response)
+    else:
+        kwargs.pop("stream", None)
+        response = await asyncio.to_thread(client.chat_completion, **kwargs)
+
+    if key is not None and response and response.get("choices"):
+        cache.set(key, response)
+    return response
+
+
+def _collect_nodes(root: KnowledgeNode) -> List[KnowledgeNode]:
+    """Return every node object in the tree once, in pre-order."""
+    seen = set()
+    nodes: List[KnowledgeNode] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes.append(node)
+        stack.extend(reversed(node.prerequisites))
+    return nodes
+
+
 def _parse_json_fallback(text: str) -> Optional[Dict[str, Any]]:
     """Fallback parser when model returned raw JSON instead of a tool call."""
     if not text:
         return None
 
     try:
-        return json.loads(text)
+        return _loads(text)
     except json.JSONDecodeError:
-        # Attempt to extract JSON block from markdown fences
-        if "```" in text:
-            segments = text.split("```")
-            for segment in segments[1::2]:
-                normalized = segment.strip()
-                if normalized.startswith("json"):
-                    normalized = normalized[4:].strip()
-                try:
-                    return json.loads(normalized)
-                except json.JSONDecodeError:
-                    continue
-        return None
+        pass
+
+    # Attempt to extract JSON block from markdown fences
+    for match in _FENCE_RE.finditer(text):
+        try:
+            return _loads(match.group(1))
+        except json.JSONDecodeError:
+            continue
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -128,6 +250,10 @@ MATHEMATICAL_CONTENT_TOOL = {
 }
 
 
+def _complexity(node: KnowledgeNode) -> str:
+    return "high school level" if node.is_foundation else "upper-undergraduate level"
+
+
 @dataclass
 class MathematicalContent:
     """Mathematical content for a concept."""
@@ -150,75 +276,204 @@ class MathematicalContent:
 
 
 class KimiMathematicalEnricher:
-    """Populate equations/definitions for each knowledge node via Kimi K2."""
+    """Populate equations/definitions for each knowledge node via Kimi K2.
 
-    def __init__(self, client: Optional[KimiClient] = None):
+    Sibling prerequisites are enriched concurrently; ``max_concurrency``
+    caps how many Kimi requests are outstanding at once. ``enrich_batch``
+    asks for up to ``batch_size`` concepts per request.
+    """
+
+    def __init__(
+        self,
+        client: Optional[KimiClient] = None,
+        max_concurrency: int = 8,
+        completion_cache: Optional[CompletionCache] = None,
+        batch_size: int = 8,
+    ):
         self.client = client or get_kimi_client()
         self.cache: Dict[str, MathematicalContent] = {}
+        # Requests under way, so concurrent duplicates of a concept share one
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.completion_cache = completion_cache
+        self.batch_size = batch_size
+        # Held only around the Kimi call, never while awaiting children,
+        # so deep trees cannot exhaust it and deadlock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def enrich_tree(self, root: KnowledgeNode) -> KnowledgeNode:
         await self._enrich_node(root)
         return root
 
-    async def _enrich_node(self, node: KnowledgeNode) -> None:
-        if node.concept in self.cache:
-            cached = self.cache[node.concept]
-            node.equations = cached.equations
-            node.definitions = cached.definitions
-            if node.visual_spec is None:
-                node.visual_spec = {}
-            node.visual_spec.setdefault("interpretation", cached.interpretation)
-            node.visual_spec.setdefault("examples", cached.examples)
-            node.visual_spec.setdefault("typical_values", cached.typical_values)
-            for prereq in node.prerequisites:
-                await self._enrich_node(prereq)
-            return
-
-        complexity = "high school level" if node.is_foundation else "upper-undergraduate level"
-
-        system_prompt = (
-            "You are an expert mathematical physicist preparing content for a "
-            "Manim animation. Provide rigorous, properly formatted LaTeX and "
-            "clear symbol definitions. Respond by calling the tool "
-            "'write_mathematical_content'. Do not include plain text responses."
-        )
+    async def enrich_batch(self, nodes: List[KnowledgeNode]) -> List[KnowledgeNode]:
+        """Enrich many nodes with one request per ``batch_size`` concepts.
+
+        Nodes sharing a concept share one entry. Concepts a batch response
+        leaves out are requested individually.
+        """
+        async for _ in self.iter_batch(nodes):
+            pass
+        return nodes
+
+    async def iter_batch(self, nodes: List[KnowledgeNode]) -> AsyncIterator[List[KnowledgeNode]]:
+        """Enrich like ``enrich_batch``, yielding nodes as each batch lands.
+
+        Cached nodes come first; after that, nodes are yielded in
+        completion order so later stages can start on them right away.
+        Concepts a batch response leaves out are requested individually
+        and yielded on their own, without holding back the rest of their
+        batch.
+        """
+        cached: List[KnowledgeNode] = []
+        pending: Dict[str, List[KnowledgeNode]] = {}
+        for node in nodes:
+            if node.concept in self.cache:
+                self._apply_content(node, self.cache[node.concept])
+                cached.append(node)
+            else:
+                pending.setdefault(node.concept, []).append(node)
+        if cached:
+            yield cached
+
+        groups = list(pending.values())
+        size = max(1, self.batch_size)
+        tasks = {
+            asyncio.ensure_future(self._enrich_chunk(groups[i:i + size]))
+            for i in range(0, len(groups), size)
+        }
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    enriched, missing = task.result()
+                    tasks.update(asyncio.ensure_future(self._enrich_group(group)) for group in missing)
+                    if enriched:
+                        yield enriched
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _enrich_chunk(
+        self,
+        groups: List[List[KnowledgeNode]],
+    ) -> Tuple[List[KnowledgeNode], List[List[KnowledgeNode]]]:
+        """Enrich one batch; each group holds the nodes sharing a concept.
+
+        Returns the enriched nodes and the groups the response left out.
+        """
+        if len(groups) > 1:
+            concept_lines = [
+                f"- Concept: {group[0].concept} | Depth: {group[0].depth} | "
+                f"Complexity target: {_complexity(group[0])}"
+                for group in groups
+            ]
+            user_prompt = (
+                "Concepts:\n"
+                + "\n".join(concept_lines)
+                + "\nFor each concept, return an entry whose 'concept' is the exact name "
+                "above, with " + MATH_CONTENT_INSTRUCTIONS
+            )
+
+            async with self._semaphore:
+                response = await _achat_completion(
+                    self.client,
+                    self.completion_cache,
+                    messages=[{"role": "user", "content": user_prompt}],
+                    system=MATH_BATCH_SYSTEM_PROMPT,
+                    tools=[MATHEMATICAL_CONTENT_BATCH_TOOL],
+                    tool_choice="auto",
+                    max_tokens=1200 * len(groups),
+                    temperature=0.2,
+                )
+
+            payload = _extract_tool_payload(response)
+            if payload is None:
+                payload = _parse_json_fallback(self.client.get_text_content(response))
+            entries = payload.get("entries") if isinstance(payload, dict) else payload
+            requested = {group[0].concept for group in groups}
+            for entry in entries if isinstance(entries, list) else []:
+                if isinstance(entry, dict) and entry.get("concept") in requested:
+                    self.cache[entry["concept"]] = MathematicalContent.from_payload(entry)
+
+        enriched: List[KnowledgeNode] = []
+        missing: List[List[KnowledgeNode]] = []
+        for group in groups:
+            content = self.cache.get(group[0].concept)
+            if content is None:
+                missing.append(group)
+                continue
+            for node in group:
+                self._apply_content(node, content)
+            enriched.extend(group)
+        return enriched, missing
+
+    async def _enrich_group(
+        self,
+        group: List[KnowledgeNode],
+    ) -> Tuple[List[KnowledgeNode], List[List[KnowledgeNode]]]:
+        """Enrich nodes sharing one concept with a single-concept request."""
+        content = await self._content_for(group[0])
+        for node in group:
+            self._apply_content(node, content)
+        return group, []
 
+    async def _enrich_node(self, node: KnowledgeNode) -> None:
+        self._apply_content(node, await self._content_for(node))
+        await asyncio.gather(*(self._enrich_node(p) for p in node.prerequisites))
+
+    async def _content_for(self, node: KnowledgeNode) -> MathematicalContent:
+        """Return the content for node's concept, requesting it at most once."""
+        content = self.cache.get(node.concept)
+        if content is not None:
+            return content
+
+        future = self._in_flight.get(node.concept)
+        if future is None:
+            future = asyncio.ensure_future(self._request_content(node))
+            self._in_flight[node.concept] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(node.concept, None))
+
+        # Shielded so one cancelled waiter does not cancel the shared request
+        content = await asyncio.shield(future)
+        self.cache[node.concept] = content
+        return content
+
+    async def _request_content(self, node: KnowledgeNode) -> MathematicalContent:
+        """Ask Kimi for a single concept's mathematical content."""
         user_prompt = (
             f"Concept: {node.concept}\n"
             f"Depth: {node.depth}\n"
-            f"Complexity target: {complexity}\n"
-            "Return 2-5 LaTeX equations (raw strings with escaped backslashes), "
-            "definitions for every symbol, at least one interpretation paragraph, "
-            "and any illustrative examples/typical values that help teach the idea."
+            f"Complexity target: {_complexity(node)}\n"
+            "Return " + MATH_CONTENT_INSTRUCTIONS
         )
 
-        response = self.client.chat_completion(
-            messages=[{"role": "user", "content": user_prompt}],
-            system=system_prompt,
-            tools=[MATHEMATICAL_CONTENT_TOOL],
-            tool_choice="auto",
-            max_tokens=1200,
-            temperature=0.2,
-        )
+        async with self._semaphore:
+            response = await _achat_completion(
+                self.client,
+                self.completion_cache,
+                messages=[{"role": "user", "content": user_prompt}],
+                system=MATH_SYSTEM_PROMPT,
+                tools=[MATHEMATICAL_CONTENT_TOOL],
+                tool_choice="auto",
+                max_tokens=1200,
+                temperature=0.2,
+            )
 
         payload = _extract_tool_payload(response)
         if payload is None:
             payload = _parse_json_fallback(self.client.get_text_content(response)) or {}
 
-        math_content = MathematicalContent.from_payload(payload)
-        self.cache[node.concept] = math_content
+        return MathematicalContent.from_payload(payload)
 
-        node.equations = math_content.equations
-        node.definitions = math_content.definitions
+    @staticmethod
+    def _apply_content(node: KnowledgeNode, content: MathematicalContent) -> None:
+        node.equations = content.equations
+        node.definitions = content.definitions
 
         if node.visual_spec is None:
             node.visual_spec = {}
-        node.visual_spec.setdefault("interpretation", math_content.interpretation)
-        node.visual_spec.setdefault("examples", math_content.examples)
-        node.visual_spec.setdefault("typical_values", math_content.typical_values)
-
-        for prereq in node.prerequisites:
-            await self._enrich_node(prereq)
+        node.visual_spec.setdefault("interpretation", content.interpretation)
+        node.visual_spec.setdefault("examples", content.examples)
+        node.visual_spec.setdefault("typical_values", content.typical_values)
 
 
 # ---------------------------------------------------------------------------
@@ -284,6 +539,22 @@ VISUAL_DESIGN_TOOL = {
 }
 
 
+VISUAL_SYSTEM_PROMPT = (
+    "You are a visual designer describing what should appear in an animation. "
+    "Focus on describing the visual content and effects, not specific implementation "
+    "details. Manim will handle the rendering automatically. Respond by calling "
+    "the 'design_visual_plan' tool."
+)
+
+VISUAL_INSTRUCTIONS = (
+    "Describe what should appear visually: what objects, shapes, or elements should be shown. "
+    "Describe colors in natural language (e.g., 'red and blue', 'gold'). "
+    "Describe animations as visual effects (e.g., 'slowly rotate', 'fade in', 'zoom into'). "
+    "Do NOT specify Manim classes like MathTex or VGroup - just describe what should be visible. "
+    "Estimate duration in seconds."
+)
+
+
 @dataclass
 class VisualSpec:
     concept: str
@@ -322,30 +593,111 @@ class VisualSpec:
 
 
 class KimiVisualDesigner:
-    """Design Manim visual specifications using Kimi tool calls."""
+    """Design Manim visual specifications using Kimi tool calls.
+
+    Each node is designed after its parent (whose spec it continues from),
+    and sibling prerequisites are designed concurrently, at most
+    ``max_concurrency`` Kimi requests at a time.
+    """
 
-    def __init__(self, client: Optional[KimiClient] = None):
+    def __init__(
+        self,
+        client: Optional[KimiClient] = None,
+        max_concurrency: int = 8,
+        completion_cache: Optional[CompletionCache] = None,
+    ):
         self.client = client or get_kimi_client()
         self.cache: Dict[str, VisualSpec] = {}
+        # Requests under way, so concurrent duplicates of a concept share one
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.completion_cache = completion_cache
+        # Held only around the Kimi call, never while awaiting children
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def design_tree(
+        self,
+        root: KnowledgeNode,
+        wait_for: Optional[Callable[[KnowledgeNode], Awaitable[Any]]] = None,
+    ) -> KnowledgeNode:
+        """Design every node concurrently, each after its parent's spec.
+
+        All nodes are scheduled at once instead of level by level, so a
+        slow concept only holds up its own descendants. A node reached by
+        several parents continues from the first one in pre-order.
+
+        Args:
+            root: Tree to design
+            wait_for: Awaited per node before its request, e.g. until the
+                node's mathematical content is available
+        """
+        parents: Dict[int, KnowledgeNode] = {}
+        for node in _collect_nodes(root):
+            for prerequisite in node.prerequisites:
+                parents.setdefault(id(prerequisite), node)
+
+        loop = asyncio.get_running_loop()
+        specs: Dict[int, asyncio.Future] = {}
+
+        async def design(node: KnowledgeNode) -> None:
+            try:
+                parent = parents.get(id(node))
+                parent_spec = await specs[id(parent)] if parent is not None else None
+                if wait_for is not None:
+                    await wait_for(node)
+                spec = await self._spec_for(node, parent_spec)
+            except asyncio.CancelledError:
+                specs[id(node)].cancel()
+                raise
+            except Exception as e:
+                specs[id(node)].set_exception(e)
+                raise
+            if node.visual_spec is None:
+                node.visual_spec = {}
+            node.visual_spec.update(spec.to_dict())
+            specs[id(node)].set_result(spec)
 
-    async def design_tree(self, root: KnowledgeNode) -> KnowledgeNode:
-        await self._design_node(root, parent_spec=None)
+        nodes = _collect_nodes(root)
+        for node in nodes:
+            specs[id(node)] = loop.create_future()
+        try:
+            await asyncio.gather(*(design(node) for node in nodes))
+        finally:
+            for future in specs.values():
+                # Failures already propagated through gather
+                if future.done() and not future.cancelled():
+                    future.exception()
         return root
 
-    async def _design_node(
+    async def _spec_for(
         self,
         node: KnowledgeNode,
         parent_spec: Optional[VisualSpec],
     ) -> VisualSpec:
-        if node.concept in self.cache:
-            cached_spec = self.cache[node.concept]
-            if node.visual_spec is None:
-                node.visual_spec = {}
-            node.visual_spec.update(cached_spec.to_dict())
-            for prereq in node.prerequisites:
-                await self._design_node(prereq, cached_spec)
-            return cached_spec
-
+        """Return the spec for node's concept, requesting it at most once.
+
+        The first parent to reach a concept provides the continuity context.
+        """
+        spec = self.cache.get(node.concept)
+        if spec is not None:
+            return spec
+
+        future = self._in_flight.get(node.concept)
+        if future is None:
+            future = asyncio.ensure_future(self._request_spec(node, parent_spec))
+            self._in_flight[node.concept] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(node.concept, None))
+
+        # Shielded so one cancelled waiter does not cancel the shared request
+        spec = await asyncio.shield(future)
+        self.cache[node.concept] = spec
+        return spec
+
+    async def _request_spec(
+        self,
+        node: KnowledgeNode,
+        parent_spec: Optional[VisualSpec],
+    ) -> VisualSpec:
+        """Ask Kimi for a single concept's visual plan."""
         previous_info = ""
         if parent_spec:
             previous_info = (
@@ -354,13 +706,6 @@ class KimiVisualDesigner:
                 f"Previous colors: {parent_spec.color_scheme}\n"
             )
 
-        system_prompt = (
-            "You are a visual designer describing what should appear in an animation. "
-            "Focus on describing the visual content and effects, not specific implementation "
-            "details. Manim will handle the rendering automatically. Respond by calling "
-            "the 'design_visual_plan' tool."
-        )
-
         user_prompt = (
             f"Concept: {node.concept}\n"
             f"Depth: {node.depth}\n"
@@ -368,38 +713,26 @@ class KimiVisualDesigner:
             f"Equations to feature: {node.equations or 'None provided'}\n"
             f"Prerequisites: {[p.concept for p in node.prerequisites]}\n"
             f"{previous_info}\n"
-            "Describe what should appear visually: what objects, shapes, or elements should be shown. "
-            "Describe colors in natural language (e.g., 'red and blue', 'gold'). "
-            "Describe animations as visual effects (e.g., 'slowly rotate', 'fade in', 'zoom into'). "
-            "Do NOT specify Manim classes like MathTex or VGroup - just describe what should be visible. "
-            "Estimate duration in seconds."
+            + VISUAL_INSTRUCTIONS
         )
 
-        response = self.client.chat_completion(
-            messages=[{"role": "user", "content": user_prompt}],
-            system=system_prompt,
-            tools=[VISUAL_DESIGN_TOOL],
-            tool_choice="auto",
-            temperature=0.4,
-            max_tokens=1200,
-        )
+        async with self._semaphore:
+            response = await _achat_completion(
+                self.client,
+                self.completion_cache,
+                messages=[{"role": "user", "content": user_prompt}],
+                system=VISUAL_SYSTEM_PROMPT,
+                tools=[VISUAL_DESIGN_TOOL],
+                tool_choice="auto",
+                temperature=0.4,
+                max_tokens=1200,
+            )
 
         payload = _extract_tool_payload(response)
         if payload is None:
             payload = _parse_json_fallback(self.client.get_text_content(response)) or {}
 
-        visual_spec = VisualSpec.from_payload(node.concept, payload)
-
-        if node.visual_spec is None:
-            node.visual_spec = {}
-        node.visual_spec.update(visual_spec.to_dict())
-
-        self.cache[node.concept] = visual_spec
-
-        for prereq in node.prerequisites:
-            await self._design_node(prereq, visual_spec)
-
-        return visual_spec
+        return VisualSpec.from_payload(node.concept, payload)
 
 
 # ---------------------------------------------------------------------------
@@ -445,6 +778,25 @@ NARRATIVE_TOOL = {
 }
 
 
+NARRATIVE_SYSTEM_PROMPT = (
+    "You are an expert STEM storyteller writing verbose prompts for "
+    "Manim. Walk through each concept in order, connecting math and "
+    "visuals, and then call 'compose_narrative' with the full text."
+)
+
+NARRATIVE_INSTRUCTIONS = (
+    "Compose a single continuous narrative (aim for ~2000 words) that:\n"
+    "- Introduces foundational ideas before advanced ones.\n"
+    "- References the provided LaTeX equations exactly as written (use raw string form r\"...\" when quoting).\n"
+    "- Describes the visual content naturally (what appears, not how Manim implements it).\n"
+    "- Integrates color schemes, animation descriptions, and transitions.\n"
+    "- Provides pacing/timing suggestions per scene.\n"
+    "- Focuses on LaTeX equations for exact math rendering - let Manim handle visual elements.\n"
+    "- Ends with a summary that prepares for Manim code generation.\n"
+    "Return your work by calling the tool."
+)
+
+
 @dataclass
 class Narrative:
     target_concept: str
@@ -466,8 +818,13 @@ class Narrative:
 class KimiNarrativeComposer:
     """Compose the long-form animation narrative using Kimi tool calling."""
 
-    def __init__(self, client: Optional[KimiClient] = None):
+    def __init__(
+        self,
+        client: Optional[KimiClient] = None,
+        completion_cache: Optional[CompletionCache] = None,
+    ):
         self.client = client or get_kimi_client()
+        self.completion_cache = completion_cache
 
     async def compose_async(self, root: KnowledgeNode) -> Narrative:
         ordered_nodes = self._topological_order(root)
@@ -479,46 +836,42 @@ class KimiNarrativeComposer:
         try:
             model_name = getattr(self.client, "model", "")
             if "8k" in model_name:
-                client = KimiClient(model=model_name.replace("8k", "32k"))
+                client = self.client.with_model(model_name.replace("8k", "32k"))
         except Exception:
             # Fall back to existing client if reinitialization fails
             client = self.client
 
-        system_prompt = (
-            "You are an expert STEM storyteller writing verbose prompts for "
-            "Manim. Walk through each concept in order, connecting math and "
-            "visuals, and then call 'compose_narrative' with the full text."
-        )
-
-        context = "\n".join(
-            self._format_node_context(idx + 1, node) for idx, node in enumerate(ordered_nodes)
-        )
-        # Avoid exceeding context window if tree is very large
+        # Avoid exceeding context window if tree is very large; nodes past
+        # the budget would be cut anyway, so they are never formatted
         max_context_chars = 18000
+        parts: List[str] = []
+        length = -1
+        for position, node in enumerate(ordered_nodes, 1):
+            part = self._format_node_context(position, node)
+            parts.append(part)
+            length += len(part) + 1
+            if length > max_context_chars:
+                break
+        context = "\n".join(parts)
         if len(context) > max_context_chars:
             context = context[:max_context_chars] + "\n...[context truncated]..."
 
         user_prompt = (
             f"Target concept: {root.concept}\n"
             f"Concept progression:\n{context}\n\n"
-            "Compose a single continuous narrative (aim for ~2000 words) that:\n"
-            "- Introduces foundational ideas before advanced ones.\n"
-            "- References the provided LaTeX equations exactly as written (use raw string form r\"...\" when quoting).\n"
-            "- Describes the visual content naturally (what appears, not how Manim implements it).\n"
-            "- Integrates color schemes, animation descriptions, and transitions.\n"
-            "- Provides pacing/timing suggestions per scene.\n"
-            "- Focuses on LaTeX equations for exact math rendering - let Manim handle visual elements.\n"
-            "- Ends with a summary that prepares for Manim code generation.\n"
-            "Return your work by calling the tool."
+            + NARRATIVE_INSTRUCTIONS
         )
 
-        response = client.chat_completion(
+        response = await _achat_completion(
+            client,
+            self.completion_cache,
             messages=[{"role": "user", "content": user_prompt}],
-            system=system_prompt,
+            system=NARRATIVE_SYSTEM_PROMPT,
             tools=[NARRATIVE_TOOL],
             tool_choice="auto",
             temperature=0.6,
             max_tokens=4000,
+            stream=True,
         )
 
         payload = _extract_tool_payload(response)
@@ -541,18 +894,33 @@ class KimiNarrativeComposer:
         )
 
     def _topological_order(self, root: KnowledgeNode) -> List[KnowledgeNode]:
+        """Return nodes prerequisites-first, one per concept.
+
+        Iterative post-order DFS, so arbitrarily deep chains cannot hit the
+        recursion limit. A node is pushed once to expand it and once more
+        to emit it after its prerequisites.
+        """
         visited = set()
         result: List[KnowledgeNode] = []
+        stack = [(root, False)]
 
-        def dfs(node: KnowledgeNode):
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                result.append(node)
+                continue
             if node.concept in visited:
-                return
+                continue
             visited.add(node.concept)
-            for prereq in node.prerequisites:
-                dfs(prereq)
-            result.append(node)
+            stack.append((node, True))
+            # Skip concepts already emitted so shared foundations are not
+            # pushed once per parent
+            stack.extend(
+                (prereq, False)
+                for prereq in reversed(node.prerequisites)
+                if prereq.concept not in visited
+            )
 
-        dfs(root)
         return result
 
     @staticmethod
@@ -565,20 +933,15 @@ class KimiNarrativeComposer:
 
     @staticmethod
     def _format_node_context(position: int, node: KnowledgeNode) -> str:
-        equations = node.equations or []
-        visual_spec = node.visual_spec or {}
-        visual_desc = visual_spec.get("visual_description", "")
-        animation_desc = visual_spec.get("animation_description", "")
-        color_scheme = visual_spec.get("color_scheme", "")
-        transitions = visual_spec.get("transitions", "")
+        spec = node.visual_spec or {}
         return (
             f"{position}. Concept: {node.concept}\n"
             f"   Depth: {node.depth}, Foundation: {node.is_foundation}\n"
-            f"   Equations: {equations}\n"
-            f"   Visual description: {visual_desc}\n"
-            f"   Animation: {animation_desc}\n"
-            f"   Colors: {color_scheme}\n"
-            f"   Transitions: {transitions}\n"
+            f"   Equations: {node.equations or []}\n"
+            f"   Visual description: {spec.get('visual_description', '')}\n"
+            f"   Animation: {spec.get('animation_description', '')}\n"
+            f"   Colors: {spec.get('color_scheme', '')}\n"
+            f"   Transitions: {spec.get('transitions', '')}\n"
         )
 
 
@@ -594,17 +957,42 @@ class EnrichmentResult:
 
 
 class KimiEnrichmentPipeline:
-    """Run mathematical enrichment, visual design, and narrative composition."""
+    """Run mathematical enrichment, visual design, and narrative composition.
 
-    def __init__(self, client: Optional[KimiClient] = None):
+    Pass a CompletionCache to reuse low-temperature responses across runs.
+    """
+
+    def __init__(
+        self,
+        client: Optional[KimiClient] = None,
+        cache: Optional[CompletionCache] = None,
+    ):
         client = client or get_kimi_client()
-        self.math = KimiMathematicalEnricher(client=client)
-        self.visual = KimiVisualDesigner(client=client)
-        self.narrative = KimiNarrativeComposer(client=client)
+        self.math = KimiMathematicalEnricher(client=client, completion_cache=cache)
+        self.visual = KimiVisualDesigner(client=client, completion_cache=cache)
+        self.narrative = KimiNarrativeComposer(client=client, completion_cache=cache)
 
     async def run_async(self, root: KnowledgeNode) -> EnrichmentResult:
-        await self.math.enrich_tree(root)
-        await self.visual.design_tree(root)
+        # Math needs no parent context, so the whole tree goes out in
+        # batches; each node's visual request starts once its batch lands
+        nodes = _collect_nodes(root)
+        math_ready = {id(node): asyncio.Event() for node in nodes}
+
+        async def enrich() -> None:
+            async for batch in self.math.iter_batch(nodes):
+                for node in batch:
+                    math_ready[id(node)].set()
+
+        async def wait_for_math(node: KnowledgeNode) -> None:
+            await math_ready[id(node)].wait()
+
+        enrich_task = asyncio.ensure_future(enrich())
+        design_task = asyncio.ensure_future(self.visual.design_tree(root, wait_for=wait_for_math))
+        try:
+            await asyncio.gather(enrich_task, design_task)
+        finally:
+            enrich_task.cancel()
+            design_task.cancel()
         narrative = await self.narrative.compose_async(root)
         return EnrichmentResult(enriched_tree=root, narrative=narrative)
 
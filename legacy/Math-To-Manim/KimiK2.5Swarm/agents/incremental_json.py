@@ -0,0 +1,128 @@
+"""
+Incremental JSON - Track a JSON document as it streams in.
+
+Streamed tool calls deliver their arguments as many small string deltas.
+Re-parsing the accumulated text after every delta to see whether it is
+finished costs O(n^2) over the stream. IncrementalJsonParser instead scans
+each delta once, tracking container depth, strings and escapes, and parses
+the document exactly once when its closing brace or bracket arrives.
+
+Example:
+    from agents.incremental_json import IncrementalJsonParser
+
+    parser = IncrementalJsonParser()
+    for delta in ('{"equations": ["E = ', 'mc^2"]}'):
+        parser.push(delta)
+    parser.result()  # {"equations": ["E = mc^2"]}
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, List, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Characters that can change the parser state; everything else is skipped
+# by the regex engine rather than inspected one by one in Python
+_STRUCTURAL_RE = re.compile(r'["\\{}\[\]]')
+
+
+class IncrementalJsonParser:
+    """
+    Accumulates chunks of a single JSON object or array.
+
+    Each pushed chunk is scanned once; the document is parsed as soon as
+    its top-level container closes. Anything pushed after that is kept in
+    text but not scanned.
+
+    Attributes:
+        complete: True once the top-level container has closed
+        error: The decode error if the completed document was invalid
+    """
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._chunks: List[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        # A backslash ended the previous chunk, so skip the next character
+        self._escape = False
+        self._value: Any = None
+        self.complete = False
+        self.error: Optional[Exception] = None
+
+    def push(self, chunk: str) -> bool:
+        """
+        Feed the next chunk of text.
+
+        Args:
+            chunk: Next piece of the JSON document
+
+        Returns:
+            True once the document is complete
+        """
+        self._chunks.append(chunk)
+        if self.complete or not chunk:
+            return self.complete
+
+        skip = 0 if self._escape else -1
+        self._escape = False
+        for match in _STRUCTURAL_RE.finditer(chunk):
+            position = match.start()
+            if position == skip:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    if position + 1 < len(chunk):
+                        skip = position + 1
+                    else:
+                        self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                self._started = True
+            elif char in "}]":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    self._finish()
+                    break
+        return self.complete
+
+    def _finish(self) -> None:
+        """Parse the accumulated document once it has closed."""
+        self.complete = True
+        try:
+            self._value = _loads(self.text)
+        except json.JSONDecodeError as e:
+            self.error = e
+
+    @property
+    def text(self) -> str:
+        """All text pushed so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def result(self) -> Any:
+        """
+        Return the parsed document.
+
+        Returns:
+            The decoded value, or None if the document is incomplete or
+            invalid
+        """
+        return self._value if self.complete and self.error is None else None
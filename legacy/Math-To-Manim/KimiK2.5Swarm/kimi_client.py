@@ -34,10 +34,20 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
+import os
+import random
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Generator, List, Optional, Union
 
-from openai import AsyncOpenAI, OpenAI
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 try:
     from tenacity import retry, stop_after_attempt, wait_exponential
@@ -52,6 +62,24 @@ except ImportError:
     stop_after_attempt = lambda x: None
     wait_exponential = lambda **kwargs: None
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 from config import (
     APIConfig,
     KimiMode,
@@ -69,6 +97,62 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Connection pool settings for the HTTP clients under OpenAI/AsyncOpenAI.
+# Concurrent agent fan-out reuses these keep-alive connections (and
+# multiplexes over HTTP/2 when h2 is installed) instead of opening new ones.
+if HAS_HTTPX:
+    HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    HTTP_TIMEOUT = httpx.Timeout(float(APIConfig.timeout), connect=5.0)
+
+# Errors achat_completion() retries with backoff (APITimeoutError is an
+# APIConnectionError); anything else is raised immediately
+RETRYABLE_API_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+
+# =============================================================================
+# Tool Result Encoding
+# =============================================================================
+
+
+# Fast paths for scalar tool results; output matches json.dumps for each type.
+_SCALAR_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    int: str,
+    bool: lambda b: "true" if b else "false",
+    type(None): lambda _: "null",
+    float: lambda f: repr(f) if math.isfinite(f) else json.dumps(f),
+}
+
+
+def _encode_tool_result(result: Any) -> str:
+    """Encode a tool result as the string content sent back to the model."""
+    if isinstance(result, str):
+        return result
+    encoder = _SCALAR_ENCODERS.get(type(result))
+    if encoder is not None:
+        return encoder(result)
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(result)
+
+
+_USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def _extract_usage(usage: Any) -> Optional[Dict[str, int]]:
+    """Convert an API usage object to a plain dict of token counts."""
+    if usage is None:
+        return None
+    if hasattr(usage, "model_dump"):
+        data = usage.model_dump(include=set(_USAGE_FIELDS))
+    elif hasattr(usage, "dict"):
+        data = usage.dict(include=set(_USAGE_FIELDS))
+    else:
+        data = {name: getattr(usage, name, None) for name in _USAGE_FIELDS}
+    return {name: data.get(name) or 0 for name in _USAGE_FIELDS}
+
 
 # =============================================================================
 # Response Dataclasses
@@ -136,6 +220,56 @@ class StreamChunk:
     finish_reason: Optional[str] = None
 
 
+class _SlotStream:
+    """
+    Async stream that holds a request slot until it is drained or closed.
+
+    A streamed request is still in flight after create() returns, so
+    achat_completion() hands its concurrency slot to this wrapper rather
+    than releasing it straight away. Everything else is delegated to the
+    wrapped SDK stream.
+    """
+
+    def __init__(self, stream: Any, slot: asyncio.Semaphore):
+        self._stream = stream
+        self._iterator = stream.__aiter__()
+        self._slot: Optional[asyncio.Semaphore] = slot
+
+    def _release(self) -> None:
+        if self._slot is not None:
+            self._slot.release()
+            self._slot = None
+
+    def __aiter__(self) -> "_SlotStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self._iterator.__anext__()
+        except BaseException:
+            # Exhausted, failed or cancelled: the request is over either way
+            self._release()
+            raise
+
+    async def close(self) -> None:
+        """Close the underlying stream and free the slot."""
+        self._release()
+        await self._stream.close()
+
+    async def __aenter__(self) -> "_SlotStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def __del__(self) -> None:
+        # Abandoned without being drained or closed
+        self._release()
+
+
 # =============================================================================
 # Main Client Class
 # =============================================================================
@@ -158,6 +292,12 @@ class KimiClient:
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         default_mode: KimiMode = KimiMode.THINKING,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: Optional[int] = None,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
     ):
         """
         Initialize the Kimi client.
@@ -167,6 +307,17 @@ class KimiClient:
             base_url: API base URL (defaults to Moonshot endpoint)
             model: Model name (defaults to KIMI_K2_MODEL)
             default_mode: Default operating mode
+            http_client: Pooled HTTP client for sync calls (a new one is
+                created and owned by this client if omitted and httpx is
+                installed)
+            async_http_client: Pooled HTTP client for async calls (created
+                the same way as http_client)
+            max_concurrency: Most achat_completion() requests in flight at
+                once (defaults to KIMI_MAX_CONCURRENCY env var, or 8)
+            retry_attempts: Total attempts for achat_completion() on rate
+                limits, connection errors and server errors
+            retry_delay: Base delay in seconds for exponential backoff
+            max_retry_delay: Upper bound in seconds for a single backoff
         """
         self.api_key = api_key or MOONSHOT_API_KEY
         if not self.api_key:
@@ -179,17 +330,102 @@ class KimiClient:
         self.base_url = base_url or MOONSHOT_BASE_URL
         self.model = model or KIMI_K2_MODEL
         self.default_mode = default_mode
+        self.max_concurrency = max_concurrency or int(os.getenv("KIMI_MAX_CONCURRENCY", "8"))
+        self.retry_attempts = max(1, retry_attempts)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        # One semaphore per event loop, since asyncio.run() starts a new loop
+        # each time and a semaphore must not be shared across loops
+        self._async_slots = weakref.WeakKeyDictionary()
+
+        # Only close the HTTP pools this client created
+        self._owns_http = http_client is None
+        self._owns_async_http = async_http_client is None
+        if HAS_HTTPX:
+            http_client = http_client or httpx.Client(
+                http2=HAS_H2, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+            )
+            async_http_client = async_http_client or httpx.AsyncClient(
+                http2=HAS_H2, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+            )
+        # None leaves the OpenAI SDK to build its default transport
+        self.http_client = http_client
+        self.async_http_client = async_http_client
 
         # Initialize clients
         self.client = OpenAI(
             api_key=self.api_key,
             base_url=self.base_url,
+            http_client=self.http_client,
         )
         self.async_client = AsyncOpenAI(
             api_key=self.api_key,
             base_url=self.base_url,
+            http_client=self.async_http_client,
         )
 
+    def with_model(self, model: str) -> "KimiClient":
+        """
+        Return a client for another model that shares this client's
+        connection pools.
+
+        Args:
+            model: Model name for the new client
+
+        Returns:
+            New KimiClient reusing this client's HTTP connections
+        """
+        clone = KimiClient(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            model=model,
+            default_mode=self.default_mode,
+            http_client=self.http_client,
+            async_http_client=self.async_http_client,
+            max_concurrency=self.max_concurrency,
+            retry_attempts=self.retry_attempts,
+            retry_delay=self.retry_delay,
+            max_retry_delay=self.max_retry_delay,
+        )
+        # Same provider account, so the concurrency limit is shared too
+        clone._async_slots = self._async_slots
+        return clone
+
+    def _async_slot(self) -> asyncio.Semaphore:
+        """Return the request semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        slot = self._async_slots.get(loop)
+        if slot is None:
+            slot = self._async_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        return slot
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for a failed attempt (0-based)."""
+        return random.uniform(0, min(self.max_retry_delay, self.retry_delay * 2 ** attempt))
+
+    def close(self) -> None:
+        """Close the sync connection pool if this client created it."""
+        if self._owns_http and self.http_client is not None:
+            self.http_client.close()
+
+    async def aclose(self) -> None:
+        """Close both connection pools if this client created them."""
+        self.close()
+        if self._owns_async_http and self.async_http_client is not None:
+            await self.async_http_client.aclose()
+
+    def __enter__(self) -> "KimiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "KimiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def _get_mode_params(self, mode: KimiMode) -> Dict[str, Any]:
         """Get API parameters for a specific mode."""
         config = get_mode_config(mode)
@@ -321,21 +557,12 @@ class KimiClient:
                 for tc in message.tool_calls
             ]
 
-        # Build usage dict
-        usage = None
-        if response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
-
         return KimiResponse(
             content=content,
             reasoning=reasoning,
             tool_calls=tool_calls,
             finish_reason=choice.finish_reason or "stop",
-            usage=usage,
+            usage=_extract_usage(response.usage),
             mode=mode,
         )
 
@@ -381,15 +608,21 @@ class KimiClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": message})
 
+        # Request parameters are fixed for the whole loop; only `messages`
+        # grows, and it is mutated in place.
+        call_kwargs = {
+            "model": self.model,
+            "tools": tools,
+            "tool_choice": "auto",
+            **params,
+        }
+
         steps = 0
         while steps < max_steps:
             # Make API call
             response = self.client.chat.completions.create(
-                model=self.model,
                 messages=messages,
-                tools=tools,
-                tool_choice="auto",
-                **params
+                **call_kwargs
             )
 
             choice = response.choices[0]
@@ -439,15 +672,11 @@ class KimiClient:
                 if on_tool_result:
                     on_tool_result(tool_name, result)
 
-                # Convert result to string
-                if not isinstance(result, str):
-                    result = json.dumps(result)
-
-                # Append tool result
+                # Append tool result (callbacks above see the native object)
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": result,
+                    "content": _encode_tool_result(result),
                 })
 
             steps += 1
@@ -460,23 +689,19 @@ class KimiClient:
     # Legacy Compatibility Methods
     # =========================================================================
 
-    def chat_completion(
+    def _legacy_params(
         self,
         messages: List[Dict[str, str]],
-        system: Optional[str] = None,
-        max_tokens: int = DEFAULT_MAX_TOKENS,
-        temperature: float = DEFAULT_TEMPERATURE,
-        top_p: float = DEFAULT_TOP_P,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
-        stream: bool = False,
+        system: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: Optional[Union[str, Dict[str, Any]]],
+        stream: bool,
         **kwargs
     ) -> Dict[str, Any]:
-        """
-        Legacy method for backward compatibility.
-
-        This provides the same interface as the original KimiClient.
-        """
+        """Build chat.completions.create() arguments for the legacy methods."""
         api_messages = []
         if system:
             api_messages.append({"role": "system", "content": system})
@@ -497,15 +722,43 @@ class KimiClient:
             if tool_choice:
                 params["tool_choice"] = tool_choice
 
+        return params
+
+    @staticmethod
+    def _check_auth_error(error: Exception) -> None:
+        """Re-raise authentication failures with a hint about the API key."""
+        error_msg = str(error)
+        if "401" in error_msg or "AuthenticationError" in str(type(error)):
+            raise ValueError(
+                f"Authentication failed (401). Please verify your MOONSHOT_API_KEY.\n"
+                f"Original error: {error_msg}"
+            ) from error
+
+    def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        top_p: float = DEFAULT_TOP_P,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Legacy method for backward compatibility.
+
+        This provides the same interface as the original KimiClient.
+        """
+        params = self._legacy_params(
+            messages, system, max_tokens, temperature, top_p, tools, tool_choice, stream, **kwargs
+        )
+
         try:
             response = self.client.chat.completions.create(**params)
         except Exception as e:
-            error_msg = str(e)
-            if "401" in error_msg or "AuthenticationError" in str(type(e)):
-                raise ValueError(
-                    f"Authentication failed (401). Please verify your MOONSHOT_API_KEY.\n"
-                    f"Original error: {error_msg}"
-                ) from e
+            self._check_auth_error(e)
             raise
 
         if stream:
@@ -513,6 +766,63 @@ class KimiClient:
 
         return self._format_response_legacy(response)
 
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        top_p: float = DEFAULT_TOP_P,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async version of chat_completion().
+
+        Uses the pooled AsyncOpenAI client, so concurrent callers do not
+        block the event loop while waiting on the API. At most
+        max_concurrency requests are in flight at once, and rate limits,
+        connection errors and server errors are retried with jittered
+        exponential backoff (the wait happens outside the limit).
+
+        With stream=True the returned stream keeps its slot until it is
+        drained or closed, so always consume or close it.
+        """
+        params = self._legacy_params(
+            messages, system, max_tokens, temperature, top_p, tools, tool_choice, stream, **kwargs
+        )
+
+        slot = self._async_slot()
+        for attempt in range(self.retry_attempts):
+            try:
+                await slot.acquire()
+                try:
+                    response = await self.async_client.chat.completions.create(**params)
+                except BaseException:
+                    slot.release()
+                    raise
+                break
+            except RETRYABLE_API_ERRORS as e:
+                if attempt + 1 >= self.retry_attempts:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"Kimi request failed ({type(e).__name__}), "
+                    f"retrying in {delay:.1f}s ({attempt + 1}/{self.retry_attempts})"
+                )
+                await asyncio.sleep(delay)
+            except Exception as e:
+                self._check_auth_error(e)
+                raise
+
+        if stream:
+            return _SlotStream(response, slot)
+
+        slot.release()
+        return self._format_response_legacy(response)
+
     def _format_response_legacy(self, response) -> Dict[str, Any]:
         """Format response to legacy dict format."""
         choice = response.choices[0]
@@ -529,11 +839,7 @@ class KimiClient:
                 },
                 "finish_reason": choice.finish_reason,
             }],
-            "usage": {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            } if response.usage else None,
+            "usage": _extract_usage(response.usage),
         }
 
         if hasattr(message, "tool_calls") and message.tool_calls:
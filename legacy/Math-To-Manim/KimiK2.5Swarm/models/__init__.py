@@ -4,7 +4,7 @@ Models layer for KimiK2Thinking.
 Provides data structures used throughout the enrichment pipeline.
 """
 
-from .knowledge_node import KnowledgeNode
+from .knowledge_node import KnowledgeNode, KnowledgeTreeSoA
 from .enrichment_result import EnrichmentResult, Narrative
 
-__all__ = ["KnowledgeNode", "EnrichmentResult", "Narrative"]
+__all__ = ["KnowledgeNode", "KnowledgeTreeSoA", "EnrichmentResult", "Narrative"]
@@ -10,6 +10,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, TYPE_CHECKING
 
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 if TYPE_CHECKING:
     from .knowledge_node import KnowledgeNode
 
@@ -106,6 +112,24 @@ class EnrichmentResult:
             execution_time_seconds=data.get("execution_time_seconds", 0.0),
         )
 
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize to MessagePack for compact persistence.
+
+        JSON via to_dict() remains the human-readable alternative. Requires
+        the optional msgpack package.
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required for to_msgpack(); pip install msgpack")
+        return msgpack.packb(self.to_dict(), use_bin_type=True)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'EnrichmentResult':
+        """Create an EnrichmentResult from to_msgpack() output."""
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required for from_msgpack(); pip install msgpack")
+        return cls.from_dict(msgpack.unpackb(data, raw=False))
+
     def summary(self) -> str:
         """Generate a human-readable summary of the enrichment result."""
         return (
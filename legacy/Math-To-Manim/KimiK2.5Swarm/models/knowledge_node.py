@@ -7,11 +7,47 @@ while adding new factory methods and utilities.
 
 from __future__ import annotations
 
+import json
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-
-
-@dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+if HAS_MSGSPEC:
+    class _KnowledgeNodeStruct(msgspec.Struct, gc=False):
+        """Typed wire schema mirroring KnowledgeNode's serialized fields."""
+        concept: str
+        depth: int
+        is_foundation: bool
+        prerequisites: List['_KnowledgeNodeStruct'] = []
+        equations: Optional[List[str]] = None
+        definitions: Optional[Dict[str, str]] = None
+        visual_spec: Optional[Dict[str, Any]] = None
+        narrative: Optional[str] = None
+
+    _STRUCT_DECODER = msgspec.json.Decoder(_KnowledgeNodeStruct)
+
+
+@dataclass(slots=True)
 class KnowledgeNode:
     """
     Represents a concept in the knowledge tree.
@@ -40,39 +76,131 @@ class KnowledgeNode:
     visual_spec: Optional[Dict[str, Any]] = None
     narrative: Optional[str] = None
 
+    def _iter_dfs(self) -> Iterator['KnowledgeNode']:
+        """
+        Iterate over this subtree in depth-first pre-order.
+
+        Uses an explicit stack so deep trees do not hit the recursion limit.
+
+        Yields:
+            Each node, parents before their prerequisites
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.prerequisites))
+
+    def _iter_unique(self) -> Iterator['KnowledgeNode']:
+        """
+        Iterate over the distinct nodes of this subtree in depth-first pre-order.
+
+        A node shared by several parents (see ``from_dict(intern=True)``) is
+        yielded, and descended into, only the first time it is reached.
+
+        Yields:
+            Each distinct node, parents before their prerequisites
+        """
+        seen = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            yield node
+            stack.extend(reversed(node.prerequisites))
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary for JSON serialization.
 
+        Enrichment fields that are still None are omitted; from_dict()
+        treats a missing key as None.
+
         Returns:
             Dictionary representation of this node and its prerequisites
         """
-        return {
-            'concept': self.concept,
-            'depth': self.depth,
-            'is_foundation': self.is_foundation,
-            'prerequisites': [p.to_dict() for p in self.prerequisites],
-            'equations': self.equations,
-            'definitions': self.definitions,
-            'visual_spec': self.visual_spec,
-            'narrative': self.narrative
-        }
+        built: Dict[int, Dict[str, Any]] = {}
+        # Reversed pre-order visits every prerequisite before its parent.
+        for node in reversed(list(self._iter_dfs())):
+            data = {
+                'concept': node.concept,
+                'depth': node.depth,
+                'is_foundation': node.is_foundation,
+                'prerequisites': [built[id(p)] for p in node.prerequisites],
+            }
+            if node.equations is not None:
+                data['equations'] = node.equations
+            if node.definitions is not None:
+                data['definitions'] = node.definitions
+            if node.visual_spec is not None:
+                data['visual_spec'] = node.visual_spec
+            if node.narrative is not None:
+                data['narrative'] = node.narrative
+            built[id(node)] = data
+        return built[id(self)]
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize this subtree to UTF-8 encoded JSON.
+
+        Uses orjson when installed and falls back to the stdlib encoder.
+
+        Returns:
+            JSON document produced from to_dict()
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict()).encode("utf-8")
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize this subtree to MessagePack.
+
+        LaTeX-heavy trees encode smaller and faster than JSON because
+        backslashes need no escaping. Requires the optional msgpack package.
+
+        Returns:
+            MessagePack document produced from to_dict()
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required for to_msgpack(); pip install msgpack")
+        return msgpack.packb(self.to_dict(), use_bin_type=True)
+
+    def format_tree(self, indent: int = 0) -> str:
+        """
+        Render the knowledge tree as an indented outline.
+
+        Args:
+            indent: Indentation level of this node
+
+        Returns:
+            One line per node, each terminated by a newline
+        """
+        lines = []
+        stack = [(self, indent)]
+        while stack:
+            node, level = stack.pop()
+            prefix = "  " * level
+            foundation_mark = " [FOUNDATION]" if node.is_foundation else ""
+            lines.append(f"{prefix}|- {node.concept} (depth {node.depth}){foundation_mark}\n")
+            stack.extend((prereq, level + 1) for prereq in reversed(node.prerequisites))
+        return "".join(lines)
 
     def print_tree(self, indent: int = 0) -> None:
         """
         Pretty print the knowledge tree.
 
+        The outline is written with a single call rather than once per node.
+
         Args:
             indent: Current indentation level
         """
-        prefix = "  " * indent
-        foundation_mark = " [FOUNDATION]" if self.is_foundation else ""
-        print(f"{prefix}|- {self.concept} (depth {self.depth}){foundation_mark}")
-        for prereq in self.prerequisites:
-            prereq.print_tree(indent + 1)
+        sys.stdout.write(self.format_tree(indent))
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'KnowledgeNode':
+    def from_dict(cls, data: Dict[str, Any], intern: bool = False) -> 'KnowledgeNode':
         """
         Create a KnowledgeNode from a dictionary.
 
@@ -80,29 +208,110 @@ class KnowledgeNode:
 
         Args:
             data: Dictionary with node data
+            intern: Share one instance per (concept, depth) among foundation
+                nodes, turning repeated foundations into a DAG so they are
+                stored and enriched once
 
         Returns:
             KnowledgeNode instance
         """
-        return cls(
+        return cls._from_dict(data, {} if intern else None)
+
+    @classmethod
+    def _from_dict(
+        cls,
+        data: Dict[str, Any],
+        interned: Optional[Dict[tuple, 'KnowledgeNode']],
+    ) -> 'KnowledgeNode':
+        """Build a node from a dictionary, reusing foundations from ``interned``."""
+        key = None
+        if interned is not None and data["is_foundation"]:
+            key = (data["concept"], data["depth"])
+            if key in interned:
+                return interned[key]
+        node = cls(
             concept=data["concept"],
             depth=data["depth"],
             is_foundation=data["is_foundation"],
-            prerequisites=[cls.from_dict(p) for p in data.get("prerequisites", [])],
+            prerequisites=[cls._from_dict(p, interned) for p in data.get("prerequisites", [])],
             equations=data.get("equations"),
             definitions=data.get("definitions"),
             visual_spec=data.get("visual_spec"),
             narrative=data.get("narrative"),
         )
+        if key is not None:
+            interned[key] = node
+        return node
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> 'KnowledgeNode':
+        """
+        Load a tree from JSON produced by to_json_bytes().
+
+        With msgspec installed the document is parsed and type-checked in a
+        single pass against a compiled schema; otherwise this is equivalent to
+        from_dict(json.loads(data)).
+
+        Args:
+            data: UTF-8 encoded JSON document
+
+        Returns:
+            KnowledgeNode instance
+        """
+        if not HAS_MSGSPEC:
+            return cls.from_dict(json.loads(data))
+        try:
+            root = _STRUCT_DECODER.decode(data)
+        except msgspec.ValidationError:
+            # Off-schema payloads (e.g. non-string definitions) are still
+            # accepted by from_dict, so keep that leniency.
+            return cls.from_dict(json.loads(data))
+
+        nodes: Dict[int, 'KnowledgeNode'] = {}
+        order = []
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            order.append(item)
+            stack.extend(item.prerequisites)
+        for item in reversed(order):
+            nodes[id(item)] = cls(
+                concept=item.concept,
+                depth=item.depth,
+                is_foundation=item.is_foundation,
+                prerequisites=[nodes[id(p)] for p in item.prerequisites],
+                equations=item.equations,
+                definitions=item.definitions,
+                visual_spec=item.visual_spec,
+                narrative=item.narrative,
+            )
+        return nodes[id(root)]
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'KnowledgeNode':
+        """
+        Load a tree from MessagePack produced by to_msgpack().
+
+        Args:
+            data: MessagePack document
+
+        Returns:
+            KnowledgeNode instance
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required for from_msgpack(); pip install msgpack")
+        return cls.from_dict(msgpack.unpackb(data, raw=False))
 
     def count_nodes(self) -> int:
         """
         Count total nodes in this subtree.
 
+        A node shared by several parents is counted once.
+
         Returns:
-            Total number of nodes including this one
+            Total number of distinct nodes including this one
         """
-        return 1 + sum(prereq.count_nodes() for prereq in self.prerequisites)
+        return sum(1 for _ in self._iter_unique())
 
     def get_max_depth(self) -> int:
         """
@@ -111,21 +320,17 @@ class KnowledgeNode:
         Returns:
             Maximum depth value
         """
-        if not self.prerequisites:
-            return self.depth
-        return max(prereq.get_max_depth() for prereq in self.prerequisites)
+        return max(node.depth for node in self._iter_dfs())
 
     def collect_all_concepts(self) -> List[str]:
         """
         Collect all concept names in the tree.
 
         Returns:
-            List of all concept names in depth-first order
+            List of all concept names in depth-first order, one per
+            distinct node
         """
-        concepts = [self.concept]
-        for prereq in self.prerequisites:
-            concepts.extend(prereq.collect_all_concepts())
-        return concepts
+        return [node.concept for node in self._iter_unique()]
 
     def get_nodes_at_depth(self, target_depth: int) -> List['KnowledgeNode']:
         """
@@ -137,30 +342,22 @@ class KnowledgeNode:
         Returns:
             List of nodes at the specified depth
         """
-        nodes = []
-        if self.depth == target_depth:
-            nodes.append(self)
-        for prereq in self.prerequisites:
-            nodes.extend(prereq.get_nodes_at_depth(target_depth))
-        return nodes
+        return [node for node in self._iter_unique() if node.depth == target_depth]
 
     def group_by_depth(self) -> Dict[int, List['KnowledgeNode']]:
         """
         Group all nodes by their depth level.
 
+        Nodes shared by several parents (see ``from_dict(intern=True)``)
+        are listed once. Callers that need the grouping repeatedly should
+        take a KnowledgeTreeSoA snapshot instead.
+
         Returns:
             Dictionary mapping depth -> list of nodes
         """
         groups: Dict[int, List['KnowledgeNode']] = {}
-
-        def collect(node: 'KnowledgeNode'):
-            if node.depth not in groups:
-                groups[node.depth] = []
-            groups[node.depth].append(node)
-            for prereq in node.prerequisites:
-                collect(prereq)
-
-        collect(self)
+        for node in self._iter_unique():
+            groups.setdefault(node.depth, []).append(node)
         return groups
 
     def is_enriched(self) -> bool:
@@ -180,3 +377,89 @@ class KnowledgeNode:
             True if visual_spec is present and non-empty
         """
         return bool(self.visual_spec)
+
+
+@dataclass(slots=True)
+class KnowledgeTreeSoA:
+    """
+    Flattened, column-oriented view of a knowledge tree.
+
+    Built once from a root with a single pre-order walk. Hot loops that only
+    need depths or parent links read the compact integer columns instead of
+    chasing KnowledgeNode pointers. Index ``i`` refers to ``nodes[i]`` in
+    every column, and the nodes are the original objects, so agents that
+    mutate ``nodes[i]`` update the tree in place.
+
+    Attributes:
+        nodes: Original KnowledgeNode objects in pre-order (root first)
+        concepts: Concept name per node
+        depth: Depth per node
+        parent_idx: Index of each node's parent (-1 for the root)
+    """
+    nodes: List[KnowledgeNode]
+    concepts: List[str]
+    depth: array
+    parent_idx: array
+
+    @classmethod
+    def from_root(cls, root: KnowledgeNode) -> 'KnowledgeTreeSoA':
+        """
+        Flatten a tree rooted at ``root``.
+
+        Shared nodes (see ``KnowledgeNode.from_dict(intern=True)``) get a
+        single index, linked to the first parent reached in pre-order.
+
+        Args:
+            root: The root KnowledgeNode
+
+        Returns:
+            KnowledgeTreeSoA covering every node in the tree
+        """
+        nodes: List[KnowledgeNode] = []
+        parent_idx = array('i')
+        seen = set()
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            index = len(nodes)
+            nodes.append(node)
+            parent_idx.append(parent)
+            stack.extend((prereq, index) for prereq in reversed(node.prerequisites))
+        return cls(
+            nodes=nodes,
+            concepts=[node.concept for node in nodes],
+            depth=array('i', (node.depth for node in nodes)),
+            parent_idx=parent_idx,
+        )
+
+    def count_nodes(self) -> int:
+        """Total number of nodes in the tree."""
+        return len(self.nodes)
+
+    def get_max_depth(self) -> int:
+        """Maximum depth value in the tree."""
+        return max(self.depth)
+
+    def collect_all_concepts(self) -> List[str]:
+        """Concept names in depth-first order."""
+        return self.concepts
+
+    def group_by_depth(self) -> Dict[int, List[int]]:
+        """
+        Group node indices by depth level.
+
+        Returns:
+            Dictionary mapping depth -> list of indices into ``nodes``
+        """
+        groups: Dict[int, List[int]] = {}
+        for index, level in enumerate(self.depth):
+            groups.setdefault(level, []).append(index)
+        return groups
+
+    def parent_of(self, index: int) -> Optional[KnowledgeNode]:
+        """Return the parent node of ``nodes[index]``, or None for the root."""
+        parent = self.parent_idx[index]
+        return self.nodes[parent] if parent >= 0 else None
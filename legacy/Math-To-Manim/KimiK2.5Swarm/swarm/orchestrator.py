@@ -11,6 +11,7 @@ Provides:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import time
 from dataclasses import dataclass, field
@@ -19,10 +20,32 @@ from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from models import KnowledgeNode, EnrichmentResult, Narrative
     from kimi_client import KimiClient
+    from agents.enrichment_agents import VisualSpec
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Task Helpers
+# =============================================================================
+
+
+async def _gather_or_cancel(tasks: List[asyncio.Task]) -> None:
+    """
+    Wait for every task, cancelling the rest as soon as one fails.
+
+    Without this a failed (or cancelled) wait leaves the other tasks calling
+    the API in the background, and their own errors are never retrieved.
+    """
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 # =============================================================================
 # Configuration and Result Dataclasses
 # =============================================================================
@@ -36,6 +59,7 @@ class EnrichmentSwarmConfig:
     enable_verification: bool = False
     enable_parallel_math: bool = True
     enable_parallel_visual: bool = True
+    math_batch_size: int = 8
 
 
 @dataclass
@@ -96,13 +120,13 @@ class EnrichmentOrchestrator:
         self._total_tool_calls = 0
         self._agents_used = 0
 
-    @property
+    @functools.cached_property
     def client(self) -> 'KimiClient':
-        """Get or create Kimi client."""
-        if self._client is None:
-            from kimi_client import get_kimi_client
-            self._client = get_kimi_client()
-        return self._client
+        """Get or create Kimi client (resolved once per instance)."""
+        if self._client is not None:
+            return self._client
+        from kimi_client import get_kimi_client
+        return get_kimi_client()
 
     async def enrich_tree(
         self,
@@ -133,50 +157,108 @@ class EnrichmentOrchestrator:
         visual_designer = VisualDesigner(client=self.client)
         narrative_composer = NarrativeComposer(client=self.client)
 
-        # Group nodes by depth level
-        depth_levels = root.group_by_depth()
-        total_nodes = root.count_nodes()
+        # Flatten once; stages dispatch by index into flat.nodes, so a node
+        # shared by several parents is enriched once
+        from models import KnowledgeTreeSoA
+        flat = KnowledgeTreeSoA.from_root(root)
+        depth_levels = flat.group_by_depth()
+        total_nodes = flat.count_nodes()
 
         # Track progress
         enriched_count = 0
 
-        # Stage 1: Mathematical enrichment (by depth level, deepest first)
+        def report_progress(stage: str, count: int = 1) -> Callable[[asyncio.Task], None]:
+            def on_done(task: asyncio.Task) -> None:
+                nonlocal enriched_count
+                if task.cancelled():
+                    return
+                enriched_count += count
+                if on_progress:
+                    on_progress(enriched_count, total_nodes * 2, stage)
+            return on_done
+
+        # One semaphore bounds every concurrent LLM call in stages 1 and 2
+        semaphore = asyncio.Semaphore(self.config.max_parallel_nodes)
+
+        async def enrich_with_semaphore(nodes: List['KnowledgeNode']) -> None:
+            async with semaphore:
+                await math_enricher.enrich_batch(nodes, batch_size)
+
+        # Stage 1: Mathematical enrichment (deepest first)
         logger.info("Stage 1: Mathematical enrichment")
-        for depth in sorted(depth_levels.keys(), reverse=True):
-            nodes = depth_levels[depth]
-
-            if self.config.enable_parallel_math:
-                # Parallel enrichment at this depth
-                tasks = [math_enricher.enrich_node(node) for node in nodes]
-                await asyncio.gather(*tasks)
-            else:
-                # Sequential enrichment
-                for node in nodes:
-                    await math_enricher.enrich_node(node)
-
-            enriched_count += len(nodes)
-            if on_progress:
-                on_progress(enriched_count, total_nodes * 2, "mathematical")
-
-        # Stage 2: Visual design (by depth level, root first)
+        # Siblings at one depth share a prompt, batch_size concepts at a time
+        batch_size = max(1, self.config.math_batch_size)
+        math_tasks: Dict[int, asyncio.Task] = {}
+        if self.config.enable_parallel_math:
+            # Math enrichment needs no parent context, so every depth level is
+            # launched in one wave bounded by the semaphore, not level by level.
+            for depth in sorted(depth_levels.keys(), reverse=True):
+                indices = depth_levels[depth]
+                for start in range(0, len(indices), batch_size):
+                    batch = indices[start:start + batch_size]
+                    task = asyncio.create_task(
+                        enrich_with_semaphore([flat.nodes[i] for i in batch])
+                    )
+                    task.add_done_callback(report_progress("mathematical", len(batch)))
+                    for i in batch:
+                        math_tasks[i] = task
+        else:
+            for depth in sorted(depth_levels.keys(), reverse=True):
+                indices = depth_levels[depth]
+                for start in range(0, len(indices), batch_size):
+                    batch = indices[start:start + batch_size]
+                    await math_enricher.enrich_batch(
+                        [flat.nodes[i] for i in batch], batch_size
+                    )
+
+                enriched_count += len(indices)
+                if on_progress:
+                    on_progress(enriched_count, total_nodes * 2, "mathematical")
+
+        # Stage 2: Visual design (root first for parent context)
         logger.info("Stage 2: Visual design")
-        for depth in sorted(depth_levels.keys()):
-            nodes = depth_levels[depth]
-
-            if self.config.enable_parallel_visual:
-                # Parallel design at this depth
-                tasks = [visual_designer.design_node(node) for node in nodes]
-                await asyncio.gather(*tasks)
-            else:
-                # Sequential design
-                for node in nodes:
-                    await visual_designer.design_node(node)
-
-            enriched_count += len(nodes)
-            if on_progress:
-                on_progress(enriched_count, total_nodes * 2, "visual")
-
-        # Stage 3: Narrative composition
+        if math_tasks and self.config.enable_parallel_visual:
+            # A node's visual design only needs its own math and its parent's
+            # visual spec, so it starts as soon as both are ready instead of
+            # waiting for the whole math stage.
+            visual_tasks: Dict[int, asyncio.Task] = {}
+
+            async def design_when_ready(i: int) -> 'VisualSpec':
+                await math_tasks[i]
+                parent = flat.parent_idx[i]
+                parent_spec = await visual_tasks[parent] if parent >= 0 else None
+                async with semaphore:
+                    return await visual_designer.design_node(flat.nodes[i], parent_spec)
+
+            # Pre-order guarantees a parent's task exists before its children's
+            for i in range(total_nodes):
+                task = asyncio.create_task(design_when_ready(i))
+                task.add_done_callback(report_progress("visual"))
+                visual_tasks[i] = task
+            await _gather_or_cancel([*math_tasks.values(), *visual_tasks.values()])
+        else:
+            if math_tasks:
+                await _gather_or_cancel(list(math_tasks.values()))
+
+            for depth in sorted(depth_levels.keys()):
+                nodes = [flat.nodes[i] for i in depth_levels[depth]]
+
+                if self.config.enable_parallel_visual:
+                    # Parallel design at this depth
+                    tasks = [visual_designer.design_node(node) for node in nodes]
+                    await asyncio.gather(*tasks)
+                else:
+                    # Sequential design
+                    for node in nodes:
+                        await visual_designer.design_node(node)
+
+                enriched_count += len(nodes)
+                if on_progress:
+                    on_progress(enriched_count, total_nodes * 2, "visual")
+
+        # Stage 3: Narrative composition. This cannot overlap stage 2: the
+        # composer's prompt and duration estimate read each node's visual
+        # description, animation, colors, transitions and duration.
         logger.info("Stage 3: Narrative composition")
         narrative = await narrative_composer.compose(root)
 
@@ -11,7 +11,9 @@ Provides optimized parallel processing of knowledge trees by:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
@@ -28,6 +30,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Task Helpers
+# =============================================================================
+
+
+async def _run_concurrently(coros: List[Any]) -> None:
+    """
+    Run coroutines concurrently and wait for all of them.
+
+    Uses asyncio.TaskGroup on Python 3.11+ for structured cancellation and
+    falls back to asyncio.gather on older runtimes.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as tg:
+            for coro in coros:
+                tg.create_task(coro)
+    else:
+        await asyncio.gather(*coros)
+
+
 # =============================================================================
 # Execution Result
 # =============================================================================
@@ -68,6 +90,7 @@ class ParallelTreeEnricher:
         self,
         max_concurrent: int = 10,
         client: Optional[Any] = None,
+        math_batch_size: int = 8,
     ):
         """
         Initialize the parallel enricher.
@@ -75,26 +98,23 @@ class ParallelTreeEnricher:
         Args:
             max_concurrent: Maximum concurrent enrichments
             client: KimiClient instance
+            math_batch_size: Concepts per mathematical enrichment request
         """
         self.max_concurrent = max_concurrent
+        self.math_batch_size = max(1, math_batch_size)
         self._client = client
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Semaphores bind to an event loop on first contended use, not here
+        self._semaphore = asyncio.Semaphore(max_concurrent)
         self._tool_calls = 0
         self._errors: List[str] = []
 
-    @property
+    @functools.cached_property
     def client(self):
-        """Get or create Kimi client."""
-        if self._client is None:
-            from kimi_client import get_kimi_client
-            self._client = get_kimi_client()
-        return self._client
-
-    def _get_semaphore(self) -> asyncio.Semaphore:
-        """Get or create semaphore for current event loop."""
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(self.max_concurrent)
-        return self._semaphore
+        """Get or create Kimi client (resolved once per instance)."""
+        if self._client is not None:
+            return self._client
+        from kimi_client import get_kimi_client
+        return get_kimi_client()
 
     async def enrich_math_level(
         self,
@@ -112,24 +132,36 @@ class ParallelTreeEnricher:
             ParallelEnrichmentResult with metrics
         """
         start_time = time.time()
-        semaphore = self._get_semaphore()
-
-        async def enrich_with_semaphore(node: 'KnowledgeNode'):
-            async with semaphore:
-                try:
-                    await enricher.enrich_node(node)
-                except Exception as e:
-                    self._errors.append(f"Math enrichment failed for {node.concept}: {e}")
-                    logger.error(f"Math enrichment failed for {node.concept}: {e}")
-
-        tasks = [enrich_with_semaphore(node) for node in nodes]
-        await asyncio.gather(*tasks)
-
+        errors: List[str] = []
+        batch_size = self.math_batch_size
+        batches = [nodes[i:i + batch_size] for i in range(0, len(nodes), batch_size)]
+
+        async def enrich_direct(batch: List['KnowledgeNode']):
+            try:
+                await enricher.enrich_batch(batch, batch_size)
+            except Exception as e:
+                concepts = ", ".join(node.concept for node in batch)
+                errors.append(f"Math enrichment failed for {concepts}: {e}")
+                logger.error(f"Math enrichment failed for {concepts}: {e}")
+
+        if len(batches) <= self.max_concurrent:
+            # The level fits within the limit; skip semaphore bookkeeping
+            await _run_concurrently([enrich_direct(batch) for batch in batches])
+        else:
+            semaphore = self._semaphore
+
+            async def enrich_with_semaphore(batch: List['KnowledgeNode']):
+                async with semaphore:
+                    await enrich_direct(batch)
+
+            await _run_concurrently([enrich_with_semaphore(batch) for batch in batches])
+
+        self._errors.extend(errors)
         return ParallelEnrichmentResult(
             nodes_processed=len(nodes),
             tool_calls=enricher.tool_calls_made,
             execution_time_seconds=time.time() - start_time,
-            errors=self._errors.copy(),
+            errors=errors,
         )
 
     async def design_visual_level(
@@ -137,6 +169,7 @@ class ParallelTreeEnricher:
         nodes: List['KnowledgeNode'],
         designer: 'VisualDesigner',
         parent_specs: Optional[Dict[str, 'VisualSpec']] = None,
+        parent_spec_lookup: Optional[Callable[['KnowledgeNode'], Optional['VisualSpec']]] = None,
     ) -> ParallelEnrichmentResult:
         """
         Design visuals for all nodes at a depth level.
@@ -145,31 +178,44 @@ class ParallelTreeEnricher:
             nodes: List of nodes at the same depth
             designer: VisualDesigner instance
             parent_specs: Mapping of concept -> parent VisualSpec
+            parent_spec_lookup: Callable returning a node's parent VisualSpec;
+                takes precedence over parent_specs when given
 
         Returns:
             ParallelEnrichmentResult with metrics
         """
         start_time = time.time()
-        semaphore = self._get_semaphore()
-        parent_specs = parent_specs or {}
-
-        async def design_with_semaphore(node: 'KnowledgeNode'):
-            async with semaphore:
-                try:
-                    parent_spec = parent_specs.get(node.concept)
-                    await designer.design_node(node, parent_spec)
-                except Exception as e:
-                    self._errors.append(f"Visual design failed for {node.concept}: {e}")
-                    logger.error(f"Visual design failed for {node.concept}: {e}")
-
-        tasks = [design_with_semaphore(node) for node in nodes]
-        await asyncio.gather(*tasks)
-
+        if parent_spec_lookup is None:
+            parent_specs = parent_specs or {}
+            parent_spec_lookup = lambda node: parent_specs.get(node.concept)
+        errors: List[str] = []
+
+        async def design_direct(node: 'KnowledgeNode'):
+            try:
+                parent_spec = parent_spec_lookup(node)
+                await designer.design_node(node, parent_spec)
+            except Exception as e:
+                errors.append(f"Visual design failed for {node.concept}: {e}")
+                logger.error(f"Visual design failed for {node.concept}: {e}")
+
+        if len(nodes) <= self.max_concurrent:
+            # The level fits within the limit; skip semaphore bookkeeping
+            await _run_concurrently([design_direct(node) for node in nodes])
+        else:
+            semaphore = self._semaphore
+
+            async def design_with_semaphore(node: 'KnowledgeNode'):
+                async with semaphore:
+                    await design_direct(node)
+
+            await _run_concurrently([design_with_semaphore(node) for node in nodes])
+
+        self._errors.extend(errors)
         return ParallelEnrichmentResult(
             nodes_processed=len(nodes),
             tool_calls=designer.tool_calls_made,
             execution_time_seconds=time.time() - start_time,
-            errors=self._errors.copy(),
+            errors=errors,
         )
 
     async def enrich_tree(
@@ -190,7 +236,7 @@ class ParallelTreeEnricher:
         Returns:
             ParallelEnrichmentResult with metrics
         """
-        from agents.enrichment_agents import MathematicalEnricher, VisualDesigner
+        from agents.enrichment_agents import MathematicalEnricher, VisualDesigner, VisualSpec
 
         start_time = time.time()
 
@@ -200,7 +246,7 @@ class ParallelTreeEnricher:
 
         # Group nodes by depth
         depth_levels = root.group_by_depth()
-        total_nodes = root.count_nodes()
+        total_nodes = sum(len(nodes) for nodes in depth_levels.values())
         completed = 0
 
         # Phase 1: Mathematical enrichment (deepest first for dependencies)
@@ -213,22 +259,30 @@ class ParallelTreeEnricher:
                 on_progress(completed, total_nodes * 2)
 
         # Phase 2: Visual design (root first for parent context)
-        parent_specs: Dict[str, 'VisualSpec'] = {}
+        child_to_parent: Dict[str, str] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for prereq in node.prerequisites:
+                child_to_parent[prereq.concept] = node.concept
+                stack.append(prereq)
+
+        concept_to_spec: Dict[str, 'VisualSpec'] = {}
+
+        def parent_spec_lookup(node: 'KnowledgeNode') -> Optional['VisualSpec']:
+            return concept_to_spec.get(child_to_parent.get(node.concept))
 
         for depth in sorted(depth_levels.keys()):
             nodes = depth_levels[depth]
-            await self.design_visual_level(nodes, visual_designer, parent_specs)
+            await self.design_visual_level(
+                nodes, visual_designer, parent_spec_lookup=parent_spec_lookup
+            )
 
-            # Update parent specs for next level
             for node in nodes:
                 if node.visual_spec:
-                    from agents.enrichment_agents import VisualSpec
-                    parent_specs[node.concept] = VisualSpec.from_payload(
+                    concept_to_spec[node.concept] = VisualSpec.from_payload(
                         node.concept, node.visual_spec
                     )
-                # Map children to this parent
-                for prereq in node.prerequisites:
-                    parent_specs[prereq.concept] = parent_specs.get(node.concept)
 
             completed += len(nodes)
             if on_progress:
@@ -6,8 +6,10 @@ Provides centralized tool management, parallel execution, and built-in tools.
 
 from .tool_registry import ToolRegistry, Tool, get_default_registry
 from .parallel_executor import ParallelToolExecutor, ToolResult, BatchResult
+from .cache_backends import CacheBackend, InMemoryBackend, SQLiteBackend
 from .builtin_tools import (
     MATHEMATICAL_CONTENT_TOOL,
+    MATHEMATICAL_CONTENT_BATCH_TOOL,
     VISUAL_DESIGN_TOOL,
     NARRATIVE_TOOL,
     ENRICHMENT_TOOLS,
@@ -20,7 +22,11 @@ __all__ = [
     "ParallelToolExecutor",
     "ToolResult",
     "BatchResult",
+    "CacheBackend",
+    "InMemoryBackend",
+    "SQLiteBackend",
     "MATHEMATICAL_CONTENT_TOOL",
+    "MATHEMATICAL_CONTENT_BATCH_TOOL",
     "VISUAL_DESIGN_TOOL",
     "NARRATIVE_TOOL",
     "ENRICHMENT_TOOLS",
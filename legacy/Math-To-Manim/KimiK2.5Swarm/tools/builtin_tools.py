@@ -62,6 +62,39 @@ MATHEMATICAL_CONTENT_TOOL = {
 }
 
 
+MATHEMATICAL_CONTENT_BATCH_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "write_mathematical_content_batch",
+        "description": (
+            "Return the key mathematical information for several concepts at "
+            "once, one entry per concept."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "entries": {
+                    "type": "array",
+                    "description": "One entry per requested concept.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "concept": {
+                                "type": "string",
+                                "description": "Concept name exactly as requested.",
+                            },
+                            **MATHEMATICAL_CONTENT_TOOL["function"]["parameters"]["properties"],
+                        },
+                        "required": ["concept", "equations", "definitions", "interpretation"],
+                    },
+                },
+            },
+            "required": ["entries"],
+        },
+    },
+}
+
+
 # =============================================================================
 # Visual Design Tool
 # =============================================================================
@@ -0,0 +1,168 @@
+"""
+Cache Backends - Pluggable second-tier storage for tool results.
+
+ParallelToolExecutor keeps a bounded in-memory LRU of recent results. A
+CacheBackend sits behind it as a second tier so results can outlive the
+process:
+- InMemoryBackend: process-local dictionary (useful for tests and sharing
+  one store between several executors)
+- SQLiteBackend: single-file SQLite database in WAL mode, shared across
+  runs and processes
+
+Example:
+    from tools import ParallelToolExecutor, SQLiteBackend
+
+    executor = ParallelToolExecutor(
+        cache_backend=SQLiteBackend("~/.cache/kimi/tools.db"),
+    )
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Protocol, Tuple, runtime_checkable
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Key/value store for serialized tool results.
+
+    Keys are strings and values opaque bytes; ttl is in seconds, with None
+    meaning the entry never expires.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store a value, replacing any existing entry."""
+        ...
+
+
+# =============================================================================
+# In-Memory Backend
+# =============================================================================
+
+
+class InMemoryBackend:
+    """Process-local CacheBackend backed by a dictionary."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        # key -> (value, expiry as time.time() or None)
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.time() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store a value, replacing any existing entry."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# =============================================================================
+# SQLite Backend
+# =============================================================================
+
+
+class SQLiteBackend:
+    """
+    CacheBackend persisted to a SQLite database.
+
+    Uses WAL journaling so readers in other processes are not blocked by
+    a writer. Expiry times are stored as Unix timestamps, which keeps them
+    meaningful across runs; expired rows are skipped on read and removed
+    when overwritten or by purge_expired().
+    """
+
+    def __init__(self, path: str = "~/.cache/kimi/tools.db"):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file path; "~" is expanded and missing parent
+                directories are created. ":memory:" gives a private
+                in-memory database.
+        """
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        # One backend may be shared by executors running on different threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at INTEGER)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (key, int(time.time())),
+            ).fetchone()
+        return bytes(row[0]) if row is not None else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store a value, replacing any existing entry."""
+        expires_at = int(time.time() + ttl) if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, sqlite3.Binary(value), expires_at),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (int(time.time()),),
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
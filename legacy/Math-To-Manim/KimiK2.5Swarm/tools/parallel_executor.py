@@ -3,28 +3,108 @@ Parallel Tool Executor - Concurrent execution with semaphore control.
 
 Provides high-performance parallel execution of tool calls with:
 - Semaphore-controlled concurrency (up to 100+ concurrent)
-- Automatic retry with exponential backoff
+- Per-tool concurrency, timeout and retry overrides from the registry
+- Automatic retry of transient failures with capped, jittered backoff
 - Timeout management
 - Execution metrics tracking
+- Result caching for repeated calls with identical arguments, optionally
+  backed by a persistent second tier (see cache_backends)
 - Both sync and async function support
 """
 
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import json
 import logging
+import random
+import threading
 import time
+import traceback
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type, Union,
+)
+
+from .cache_backends import CacheBackend
+from .tool_registry import Tool
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:  # not installed, or Windows where uvloop is unavailable
+    HAS_UVLOOP = False
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# =============================================================================
+# JSON Helpers
+# =============================================================================
+
+
+if HAS_ORJSON:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def _canonical_json(obj: Any) -> str:
+        """Serialize with sorted keys so equal arguments map to one string."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode("utf-8")
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+    def _canonical_json(obj: Any) -> str:
+        """Serialize with sorted keys so equal arguments map to one string."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@functools.lru_cache(maxsize=2048)
+def _canonical_arguments(arguments_str: str) -> str:
+    """Canonicalize a tool-call argument string, once per distinct string."""
+    return _canonical_json(_loads(arguments_str))
+
+
+def _parse_arguments(arguments_str: str) -> Tuple[Any, str]:
+    """
+    Parse a tool-call argument string and return it with its canonical form.
+
+    Only the canonical string is cached. The arguments are parsed afresh on
+    every call, so a tool that mutates (or returns) nested values cannot
+    change what a later call with the same string receives.
+    """
+    return _loads(arguments_str), _canonical_arguments(arguments_str)
+
+
+def _backend_key(cache_key: Tuple[str, str]) -> str:
+    """Flatten an in-memory cache key into a CacheBackend key."""
+    tool_name, canonical = cache_key
+    return f"{tool_name}:{canonical}"
+
+
+@dataclass(frozen=True, slots=True)
 class ToolResult:
     """
     Result of a single tool execution.
 
+    Immutable: cached results are shared between calls, and copies for
+    another call id are made with dataclasses.replace().
+
     Attributes:
         tool_call_id: Unique identifier for this tool call
         tool_name: Name of the executed tool
@@ -39,13 +119,22 @@ class ToolResult:
     success: bool = True
     error: Optional[str] = None
     execution_time_ms: float = 0.0
+    # Serialized message content, filled on first use; replace() carries it over
+    _content: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def message_content(self) -> str:
+        """Return the message content string, serializing the result only once."""
+        content = self._content
+        if content is None:
+            content = self.result if self.success else f"Error: {self.error}"
+            if not isinstance(content, str):
+                content = _dumps(content)
+            object.__setattr__(self, "_content", content)
+        return content
 
     def to_message(self) -> Dict[str, Any]:
         """Convert to tool result message format for API."""
-        content = self.result if self.success else f"Error: {self.error}"
-        if not isinstance(content, str):
-            import json
-            content = json.dumps(content)
+        content = self.message_content()
 
         return {
             "role": "tool",
@@ -54,7 +143,17 @@ class ToolResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
+class _LoopState:
+    """Executor state bound to one event loop (asyncio primitives cannot be shared)."""
+    semaphore: asyncio.Semaphore
+    # tool name -> semaphore for tools registered with max_concurrent
+    tool_semaphores: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+    # key -> future resolved by the call currently executing those arguments
+    in_flight: Dict[Tuple[str, str], asyncio.Future] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
 class BatchResult:
     """
     Result of a batch tool execution.
@@ -64,11 +163,33 @@ class BatchResult:
         total_time_ms: Total batch execution time
         successful_count: Number of successful executions
         failed_count: Number of failed executions
+        cache_hits: Number of calls answered from the result cache or by an
+            identical call already in flight
+        cache_misses: Number of cacheable calls that had to execute
     """
     results: List[ToolResult] = field(default_factory=list)
     total_time_ms: float = 0.0
     successful_count: int = 0
     failed_count: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @classmethod
+    async def from_stream(cls, stream: AsyncIterable[ToolResult]) -> 'BatchResult':
+        """
+        Collect a stream of results (e.g. from execute_batch_stream).
+
+        Results keep arrival order; total_time_ms covers draining the stream.
+        """
+        start_ns = time.perf_counter_ns()
+        results = [result async for result in stream]
+        successful_count = sum(1 for result in results if result.success)
+        return cls(
+            results=results,
+            total_time_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+            successful_count=successful_count,
+            failed_count=len(results) - successful_count,
+        )
 
     @property
     def all_successful(self) -> bool:
@@ -86,13 +207,23 @@ class ParallelToolExecutor:
 
     Features:
     - Semaphore-based concurrency control
-    - Automatic retry with exponential backoff
+    - Per-tool limits for rate-limited tools (Tool.max_concurrent,
+      Tool.timeout, Tool.retry_attempts)
+    - Automatic retry of transient failures with capped, jittered backoff
     - Timeout management per call
     - Metrics tracking
+    - Opt-in LRU result cache (cache_size > 0) keyed on (tool name,
+      canonical arguments), with an optional persistent CacheBackend as a
+      second tier
+    - Identical concurrent calls share a single execution
+    - Only Tool objects registered with cacheable=True are cached or
+      shared; plain callables always run
     - Support for both sync and async tools
+    - Inline execution of cheap pass-through tools (Tool.inline)
 
     Example:
         executor = ParallelToolExecutor(max_concurrent=50)
+        # or: async with ParallelToolExecutor(max_concurrent=50) as executor:
 
         tool_calls = [
             {"id": "1", "function": {"name": "search", "arguments": '{"q": "test"}'}},
@@ -109,96 +240,301 @@ class ParallelToolExecutor:
         timeout_per_call: float = 60.0,
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        max_retry_delay: float = 30.0,
+        retry_jitter: float = 0.5,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError),
+        cache_backend: Optional[CacheBackend] = None,
+        use_uvloop: bool = True,
+        include_tracebacks: bool = False,
     ):
         """
         Initialize the parallel executor.
 
         Args:
-            max_concurrent: Maximum concurrent executions
+            max_concurrent: Maximum concurrent executions per event loop
+                (sync tools on every loop also share one pool of this size)
             timeout_per_call: Timeout per tool call in seconds
-            retry_attempts: Number of retry attempts on failure
+            retry_attempts: Number of attempts per call (values below 1 run
+                the call once)
             retry_delay: Base delay between retries (exponential backoff)
+            cache_size: Maximum cached results (0, the default, disables
+                the in-memory cache)
+            cache_ttl: Seconds a cached result stays valid (None = no expiry)
+            max_retry_delay: Upper bound on a single backoff sleep in seconds
+            retry_jitter: Random extra fraction added to each backoff (0 = none)
+            retryable_exceptions: Exception types worth retrying; anything
+                else (e.g. TypeError from bad arguments) fails immediately.
+                Per-call timeouts are always retried.
+            cache_backend: Second-tier store consulted after an in-memory
+                miss and filled on every successful cacheable call, e.g.
+                SQLiteBackend to reuse results across runs. Only results
+                that serialize to JSON are persisted. Backend reads and
+                writes run in worker threads, never on the event loop.
+            use_uvloop: Run execute_batch_sync's background loop on uvloop
+                when it is installed; falls back to the stdlib loop
+                otherwise (always on Windows). Async callers choose their
+                own loop.
+            include_tracebacks: Append the full traceback to failed results'
+                error text (for debugging; it is sent back to the model)
         """
         self.max_concurrent = max_concurrent
         self.timeout_per_call = timeout_per_call
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.max_retry_delay = max_retry_delay
+        self.retry_jitter = retry_jitter
+        self.retryable_exceptions = retryable_exceptions
+        self.cache_backend = cache_backend
+        self.use_uvloop = use_uvloop
+        self.include_tracebacks = include_tracebacks
+        # Semaphores and in-flight futures per event loop, so execute_batch on
+        # the caller's loop and execute_batch_sync's background loop can mix
+        self._loop_states: Dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        # key -> (result, expiry as time.monotonic() or None)
+        self._cache: OrderedDict[Tuple[str, str], Tuple[ToolResult, Optional[float]]] = OrderedDict()
+        # Sync tools run here rather than on the loop's shared default pool
+        self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent,
+            thread_name_prefix="tool-exec",
+        )
+        # Background loop for execute_batch_sync, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._closed = False
+
+    def _loop_state(self) -> _LoopState:
+        """Return the running loop's semaphores and in-flight table, creating them once."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            # Forget loops that have since been closed (e.g. earlier asyncio.run calls)
+            for old in [old for old in list(self._loop_states) if old.is_closed()]:
+                self._loop_states.pop(old, None)
+            state = _LoopState(semaphore=asyncio.Semaphore(self.max_concurrent))
+            self._loop_states[loop] = state
+        return state
+
+    def _check_open(self) -> None:
+        """Refuse new batches once close() has released the workers."""
+        if self._closed:
+            raise RuntimeError("ParallelToolExecutor is closed")
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[ToolResult]:
+        """Return a live cached result and mark it recently used."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        result, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: Tuple[str, str], result: ToolResult) -> None:
+        """Store a successful result, evicting the least recently used entry."""
+        try:
+            # Serialize once here so every copy handed out on a hit shares it
+            result.message_content()
+        except (TypeError, ValueError):
+            pass  # to_message() will report it if the result is ever sent
+        expires_at = time.monotonic() + self.cache_ttl if self.cache_ttl is not None else None
+        self._cache[key] = (result, expires_at)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _tool_semaphore(self, tool: Tool) -> Optional[asyncio.Semaphore]:
+        """Return the semaphore enforcing a tool's own concurrency cap, if any."""
+        if tool.max_concurrent is None:
+            return None
+        tool_semaphores = self._loop_state().tool_semaphores
+        semaphore = tool_semaphores.get(tool.name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(tool.max_concurrent)
+            tool_semaphores[tool.name] = semaphore
+        return semaphore
+
+    def _backend_get(self, key: Tuple[str, str], tool_name: str) -> Optional[ToolResult]:
+        """Load a result from the second-tier cache, if configured and present."""
+        if self.cache_backend is None:
+            return None
+        try:
+            payload = self.cache_backend.get(_backend_key(key))
+            if payload is None:
+                return None
+            result = _loads(payload)
+        except Exception as e:
+            logger.warning(f"Cache backend read failed for {tool_name}: {e}")
+            return None
+        return ToolResult(tool_call_id="", tool_name=tool_name, result=result)
+
+    def _backend_put(self, key: Tuple[str, str], result: ToolResult) -> None:
+        """Persist a successful result to the second-tier cache, if configured."""
+        if self.cache_backend is None:
+            return
+        try:
+            payload = _dumps(result.result).encode("utf-8")
+        except (TypeError, ValueError):
+            logger.debug(f"Result of {result.tool_name} is not JSON-serializable; not persisted")
+            return
+        try:
+            self.cache_backend.set(_backend_key(key), payload, self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"Cache backend write failed for {result.tool_name}: {e}")
+
+    def clear_cache(self) -> None:
+        """Drop all in-memory cached tool results (the backend is left intact)."""
+        self._cache.clear()
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the executor's private event loop, starting its thread if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                if self.use_uvloop and HAS_UVLOOP:
+                    loop = uvloop.new_event_loop()
+                else:
+                    loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="tool-exec-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def close(self) -> None:
+        """
+        Shut down the worker threads used for sync tools and the background loop.
 
-    def _get_semaphore(self) -> asyncio.Semaphore:
-        """Get or create the semaphore for the current event loop."""
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(self.max_concurrent)
-        return self._semaphore
+        Later batches raise RuntimeError instead of failing inside tool calls.
+        """
+        self._closed = True
+        self._thread_pool.shutdown(wait=False)
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def __aenter__(self) -> 'ParallelToolExecutor':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     async def execute_batch(
         self,
         tool_calls: List[Dict[str, Any]],
         tool_map: Dict[str, Callable],
         on_progress: Optional[Callable[[int, int], None]] = None,
+        progress_interval: int = 1,
     ) -> BatchResult:
         """
         Execute multiple tool calls in parallel.
 
         Args:
             tool_calls: List of tool call dictionaries with id, function.name, function.arguments
-            tool_map: Dictionary mapping tool names to callable functions
+            tool_map: Dictionary mapping tool names to callable functions, or
+                to registry Tool objects (see ToolRegistry.get_tools()) whose
+                metadata is used directly; only tools with ``cacheable=True``
+                are cached or deduplicated (plain callables never are), and
+                per-tool ``max_concurrent``/``timeout``/``retry_attempts``
+                override the executor defaults
             on_progress: Optional callback(completed, total) for progress tracking
+            progress_interval: Report progress every N completions (the final
+                completion is always reported)
 
         Returns:
-            BatchResult with all execution results
+            BatchResult with all execution results, in tool_calls order
         """
-        start_time = time.time()
+        self._check_open()
         total = len(tool_calls)
-        completed = 0
-
-        async def execute_with_progress(call: Dict[str, Any]) -> ToolResult:
-            nonlocal completed
-            result = await self._execute_single(call, tool_map)
-            completed += 1
-            if on_progress:
-                on_progress(completed, total)
-            return result
-
-        # Create tasks for all tool calls
-        tasks = [execute_with_progress(call) for call in tool_calls]
-
-        # Execute all tasks concurrently (semaphore controls actual parallelism)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        batch_result = BatchResult()
-        for result in results:
-            if isinstance(result, Exception):
-                # Handle unexpected exceptions
-                batch_result.results.append(ToolResult(
-                    tool_call_id="unknown",
-                    tool_name="unknown",
-                    result=None,
-                    success=False,
-                    error=str(result),
-                ))
-                batch_result.failed_count += 1
-            else:
-                batch_result.results.append(result)
-                if result.success:
-                    batch_result.successful_count += 1
-                else:
-                    batch_result.failed_count += 1
-
-        batch_result.total_time_ms = (time.time() - start_time) * 1000
+        cache_stats = {"hits": 0, "misses": 0}
+        ordered: List[Optional[ToolResult]] = [None] * total
+
+        async def collect() -> AsyncIterator[ToolResult]:
+            completed = 0
+            stream = self._execute_indexed(tool_calls, tool_map, cache_stats)
+            async with contextlib.aclosing(stream):
+                async for index, result in stream:
+                    ordered[index] = result
+                    completed += 1
+                    if on_progress and (completed == total or completed % progress_interval == 0):
+                        on_progress(completed, total)
+                    yield result
+
+        batch_result = await BatchResult.from_stream(collect())
+        batch_result.results = ordered
+        batch_result.cache_hits = cache_stats["hits"]
+        batch_result.cache_misses = cache_stats["misses"]
         return batch_result
 
-    async def _execute_single(
+    async def execute_batch_stream(
         self,
-        tool_call: Dict[str, Any],
+        tool_calls: List[Dict[str, Any]],
         tool_map: Dict[str, Callable],
-    ) -> ToolResult:
-        """Execute a single tool call with retry logic."""
-        import json
+        cache_stats: Optional[Dict[str, int]] = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Execute tool calls in parallel, yielding each result as it completes.
+
+        Lets callers build tool messages while slower calls are still
+        running. Leaving the loop early cancels the calls still pending.
+
+        Args:
+            tool_calls: List of tool call dictionaries with id, function.name, function.arguments
+            tool_map: Dictionary mapping tool names to callables or Tool
+                objects (see execute_batch)
+            cache_stats: Optional dict whose "hits"/"misses" counters are
+                incremented as calls resolve
 
-        semaphore = self._get_semaphore()
+        Yields:
+            ToolResult for each call, in completion order
+        """
+        self._check_open()
+        stream = self._execute_indexed(tool_calls, tool_map, cache_stats)
+        async with contextlib.aclosing(stream):
+            async for _, result in stream:
+                yield result
+
+    async def _execute_indexed(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        tool_map: Dict[str, Callable],
+        cache_stats: Optional[Dict[str, int]] = None,
+    ) -> AsyncIterator[Tuple[int, ToolResult]]:
+        """Run all calls concurrently and yield (call index, result) as each completes."""
+        async def run(index: int, call: Dict[str, Any]) -> Tuple[int, ToolResult]:
+            return index, await self._execute_single(call, tool_map, cache_stats)
+
+        # Create tasks for all tool calls (semaphore controls actual parallelism)
+        tasks = [asyncio.ensure_future(run(i, call)) for i, call in enumerate(tool_calls)]
+        try:
+            # _execute_single reports tool failures as results rather than raising
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled calls unwind (and release in-flight entries) before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def _execute_single(
+        self,
+        tool_call: Dict[str, Any],
+        tool_map: Dict[str, Union[Callable, Tool]],
+        cache_stats: Optional[Dict[str, int]] = None,
+    ) -> ToolResult:
+        """Execute a single tool call with caching, deduplication and retry logic."""
         # Extract tool call details
         call_id = tool_call.get("id", "unknown")
         function = tool_call.get("function", {})
@@ -206,8 +542,12 @@ class ParallelToolExecutor:
         arguments_str = function.get("arguments", "{}")
 
         # Parse arguments
+        canonical = None
         try:
-            arguments = json.loads(arguments_str) if isinstance(arguments_str, str) else arguments_str
+            if isinstance(arguments_str, str):
+                arguments, canonical = _parse_arguments(arguments_str)
+            else:
+                arguments = arguments_str
         except json.JSONDecodeError as e:
             return ToolResult(
                 tool_call_id=call_id,
@@ -228,30 +568,178 @@ class ParallelToolExecutor:
             )
 
         tool_func = tool_map[tool_name]
+        if isinstance(tool_func, Tool):
+            tool = tool_func
+            if tool.inline and not tool.is_async:
+                return self._execute_inline(call_id, tool_name, tool.func, arguments)
+            reusable = tool.cacheable
+            execute = functools.partial(
+                self._execute_with_retry,
+                call_id,
+                tool_name,
+                tool.func,
+                tool.is_async,
+                arguments,
+                timeout=tool.timeout,
+                retry_attempts=tool.retry_attempts,
+                tool_semaphore=self._tool_semaphore(tool),
+            )
+        else:
+            # Nothing says a bare callable is pure, so it always runs
+            reusable = False
+            execute = functools.partial(
+                self._execute_with_retry,
+                call_id,
+                tool_name,
+                tool_func,
+                asyncio.iscoroutinefunction(tool_func),
+                arguments,
+            )
+
+        cache_key = None
+        if reusable:
+            try:
+                cache_key = (tool_name, canonical or _canonical_json(arguments))
+            except (TypeError, ValueError):
+                cache_key = None
+        if cache_key is None:
+            return await execute()
+
+        if self.cache_size > 0:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                if cache_stats is not None:
+                    cache_stats["hits"] += 1
+                return dataclasses.replace(cached, tool_call_id=call_id, execution_time_ms=0.0)
+
+        stored = None
+        if self.cache_backend is not None:
+            # Backend reads (e.g. SQLite queries) block, so keep them off the loop
+            stored = await asyncio.to_thread(self._backend_get, cache_key, tool_name)
+        if stored is not None:
+            if cache_stats is not None:
+                cache_stats["hits"] += 1
+            if self.cache_size > 0:
+                self._cache_put(cache_key, stored)
+            return dataclasses.replace(stored, tool_call_id=call_id)
+
+        # An identical call is already running: share its result
+        in_flight = self._loop_state().in_flight
+        pending = in_flight.get(cache_key)
+        while pending is not None:
+            shared = await asyncio.shield(pending)
+            if shared is not None:
+                if cache_stats is not None:
+                    cache_stats["hits"] += 1
+                return dataclasses.replace(shared, tool_call_id=call_id, execution_time_ms=0.0)
+            # The owning call was cancelled: run it here unless another waiter already is
+            pending = in_flight.get(cache_key)
+
+        if cache_stats is not None:
+            cache_stats["misses"] += 1
+        pending = asyncio.get_running_loop().create_future()
+        in_flight[cache_key] = pending
+        tool_result = None
+        try:
+            tool_result = await execute()
+        finally:
+            del in_flight[cache_key]
+            # None tells waiters this call never finished, without cancelling them
+            pending.set_result(tool_result)
+
+        if tool_result.success:
+            if self.cache_size > 0:
+                self._cache_put(cache_key, tool_result)
+            if self.cache_backend is not None:
+                await asyncio.to_thread(self._backend_put, cache_key, tool_result)
+        return tool_result
+
+    def _format_error(self, exc: BaseException) -> str:
+        """Describe a tool failure as "ExceptionType: message"."""
+        error = f"{type(exc).__name__}: {exc}"
+        if self.include_tracebacks:
+            error += "\n" + "".join(traceback.format_exception(exc))
+        return error
+
+    def _execute_inline(
+        self,
+        call_id: str,
+        tool_name: str,
+        tool_func: Callable,
+        arguments: Dict[str, Any],
+    ) -> ToolResult:
+        """Call a cheap sync tool directly on the event loop, once."""
+        start_ns = time.perf_counter_ns()
+        try:
+            result = tool_func(**arguments)
+        except Exception as e:
+            logger.warning(f"Tool {tool_name} failed: {e}")
+            return ToolResult(
+                tool_call_id=call_id,
+                tool_name=tool_name,
+                result=None,
+                success=False,
+                error=self._format_error(e),
+            )
+        return ToolResult(
+            tool_call_id=call_id,
+            tool_name=tool_name,
+            result=result,
+            success=True,
+            execution_time_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+        )
+
+    async def _execute_with_retry(
+        self,
+        call_id: str,
+        tool_name: str,
+        tool_func: Callable,
+        is_async: bool,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None,
+        retry_attempts: Optional[int] = None,
+        tool_semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> ToolResult:
+        """
+        Run a resolved tool, retrying failures with exponential backoff.
+
+        timeout and retry_attempts fall back to the executor defaults; an
+        attempt count below 1 still runs the call once. A
+        tool_semaphore is always acquired before the executor-wide one, so
+        calls waiting on a rate-limited tool hold no global slot and the
+        fixed order cannot deadlock.
+        """
+        semaphore = self._loop_state().semaphore
+        tool_slot = tool_semaphore or contextlib.nullcontext()
+        if timeout is None:
+            timeout = self.timeout_per_call
+        if retry_attempts is None:
+            retry_attempts = self.retry_attempts
+        retry_attempts = max(1, retry_attempts)
+        loop = asyncio.get_running_loop()
 
-        # Execute with retry
         last_error = None
-        for attempt in range(self.retry_attempts):
+        for attempt in range(retry_attempts):
             try:
-                async with semaphore:
-                    start_time = time.time()
+                async with tool_slot, semaphore:
+                    start_ns = time.perf_counter_ns()
 
                     # Execute the tool (handle both sync and async)
-                    if asyncio.iscoroutinefunction(tool_func):
+                    if is_async:
                         result = await asyncio.wait_for(
                             tool_func(**arguments),
-                            timeout=self.timeout_per_call
+                            timeout=timeout
                         )
                     else:
                         # Run sync function in thread pool
                         result = await asyncio.wait_for(
-                            asyncio.get_event_loop().run_in_executor(
-                                None, lambda: tool_func(**arguments)
+                            loop.run_in_executor(
+                                self._thread_pool, functools.partial(tool_func, **arguments)
                             ),
-                            timeout=self.timeout_per_call
+                            timeout=timeout
                         )
 
-                    execution_time = (time.time() - start_time) * 1000
+                    execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
 
                     return ToolResult(
                         tool_call_id=call_id,
@@ -262,16 +750,21 @@ class ParallelToolExecutor:
                     )
 
             except asyncio.TimeoutError:
-                last_error = f"Timeout after {self.timeout_per_call}s"
+                last_error = f"Timeout after {timeout}s"
                 logger.warning(f"Tool {tool_name} timed out (attempt {attempt + 1})")
 
             except Exception as e:
-                last_error = str(e)
+                last_error = self._format_error(e)
                 logger.warning(f"Tool {tool_name} failed (attempt {attempt + 1}): {e}")
+                if not isinstance(e, self.retryable_exceptions):
+                    break
 
-            # Exponential backoff before retry
-            if attempt < self.retry_attempts - 1:
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+            # Exponential backoff before retry; the slot is already released.
+            # Jitter keeps calls that failed together from retrying in lockstep.
+            if attempt < retry_attempts - 1:
+                delay = self.retry_delay * (2 ** attempt)
+                delay *= 1 + random.uniform(0, self.retry_jitter)
+                await asyncio.sleep(min(delay, self.max_retry_delay))
 
         # All retries failed
         return ToolResult(
@@ -290,6 +783,11 @@ class ParallelToolExecutor:
         """
         Synchronous wrapper for execute_batch.
 
+        Batches run on one background event loop that lives until close(),
+        so repeated calls skip loop setup and keep sharing that loop's
+        semaphores and in-flight table. Use execute_batch directly from
+        async code.
+
         Args:
             tool_calls: List of tool call dictionaries
             tool_map: Dictionary mapping tool names to functions
@@ -297,7 +795,11 @@ class ParallelToolExecutor:
         Returns:
             BatchResult with all execution results
         """
-        return asyncio.run(self.execute_batch(tool_calls, tool_map))
+        self._check_open()
+        future = asyncio.run_coroutine_threadsafe(
+            self.execute_batch(tool_calls, tool_map), self._background_loop()
+        )
+        return future.result()
 
 
 # =============================================================================
@@ -34,15 +34,54 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import inspect
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, get_origin, get_type_hints,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# =============================================================================
+# Parameter Introspection
+# =============================================================================
+
+
+# Python type (or generic origin, e.g. List[str] -> list) -> JSON schema type
+_TYPE_MAP: Dict[Any, str] = {
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+
+def _json_type(hint: Any) -> str:
+    """Map a type hint to a JSON schema type, defaulting to "string"."""
+    json_type = _TYPE_MAP.get(hint)
+    if json_type is None:
+        json_type = _TYPE_MAP.get(get_origin(hint), "string")
+    return json_type
+
+
+@functools.lru_cache(maxsize=256)
+def _introspect(func: Callable) -> Tuple[Tuple[inspect.Parameter, ...], Dict[str, Any]]:
+    """Return a function's parameters and resolved type hints, once per function."""
+    parameters = tuple(inspect.signature(func).parameters.values())
+    try:
+        hints = get_type_hints(func)
+    except Exception:
+        hints = {}
+    return parameters, hints
+
+
+@dataclass(slots=True)
 class Tool:
     """
     Representation of a registered tool.
@@ -56,6 +95,17 @@ class Tool:
         tags: Additional tags for discovery
         enabled: Whether the tool is currently enabled
         requires_auth: Whether the tool requires authentication
+        cacheable: Whether results may be reused for identical arguments;
+            off unless set, since a cached call skips its side effects
+        max_concurrent: Cap on simultaneous executions of this tool
+            (None = only the executor-wide limit applies)
+        timeout: Per-call timeout in seconds (None = executor default)
+        retry_attempts: Attempts per call (None = executor default); 1 or 0
+            runs the call once with no backoff
+        inline: Run directly on the event loop, bypassing semaphores, the
+            thread pool, timeouts, retries and the result cache; for cheap,
+            pure sync functions that cannot fail transiently
+        is_async: Whether func is a coroutine function (derived from func)
     """
     name: str
     func: Callable
@@ -65,10 +115,18 @@ class Tool:
     tags: List[str] = field(default_factory=list)
     enabled: bool = True
     requires_auth: bool = False
-
-    def to_openai_schema(self) -> Dict[str, Any]:
-        """Convert to OpenAI function calling schema."""
-        return {
+    cacheable: bool = False
+    max_concurrent: Optional[int] = None
+    timeout: Optional[float] = None
+    retry_attempts: Optional[int] = None
+    inline: bool = False
+    is_async: bool = field(default=False, init=False)
+    _openai_schema: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.is_async = asyncio.iscoroutinefunction(self.func)
+        # name, description and parameters are fixed once registered
+        self._openai_schema = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -77,6 +135,14 @@ class Tool:
             }
         }
 
+    def to_openai_schema(self) -> Dict[str, Any]:
+        """
+        Convert to OpenAI function calling schema.
+
+        Returns the dict built at construction; callers must not mutate it.
+        """
+        return self._openai_schema
+
     def __call__(self, *args, **kwargs):
         """Make the tool callable."""
         return self.func(*args, **kwargs)
@@ -96,7 +162,17 @@ class ToolRegistry:
     def __init__(self):
         """Initialize empty registry."""
         self._tools: Dict[str, Tool] = {}
+        # Indexes kept in step by register/clear so lookups only visit
+        # matching tools. Category lists keep registration order.
         self._categories: Dict[str, List[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        # (category, tags, enabled_only) -> (candidate tools, their enabled
+        # flags, get_openai_tools() result). The flags are re-checked on
+        # every call, so toggling Tool.enabled directly is picked up too.
+        self._openai_tools_cache: Dict[
+            Tuple[Optional[str], frozenset, bool],
+            Tuple[List[Tool], Tuple[bool, ...], List[Dict[str, Any]]],
+        ] = {}
 
     def register(
         self,
@@ -107,6 +183,11 @@ class ToolRegistry:
         category: str = "general",
         tags: Optional[List[str]] = None,
         requires_auth: bool = False,
+        cacheable: bool = False,
+        max_concurrent: Optional[int] = None,
+        timeout: Optional[float] = None,
+        retry_attempts: Optional[int] = None,
+        inline: bool = False,
     ) -> Tool:
         """
         Register a new tool.
@@ -119,6 +200,14 @@ class ToolRegistry:
             category: Tool category for filtering
             tags: Additional tags for discovery
             requires_auth: Whether the tool requires authentication
+            cacheable: Whether results may be reused for identical arguments;
+                only pass True for pure tools without side effects
+            max_concurrent: Cap on simultaneous executions of this tool, e.g.
+                for a rate-limited API (None = executor-wide limit only)
+            timeout: Per-call timeout in seconds (None = executor default)
+            retry_attempts: Attempts per call (None = executor default)
+            inline: Call the function directly on the event loop instead of
+                through the executor machinery (ignored for async functions)
 
         Returns:
             The registered Tool instance
@@ -146,18 +235,52 @@ class ToolRegistry:
             category=category,
             tags=tags or [],
             requires_auth=requires_auth,
+            cacheable=cacheable,
+            max_concurrent=max_concurrent,
+            timeout=timeout,
+            retry_attempts=retry_attempts,
+            inline=inline,
         )
 
         self._tools[name] = tool
 
-        # Update category index
+        # Update indexes
         if category not in self._categories:
             self._categories[category] = []
         self._categories[category].append(name)
+        for tag in tool.tags:
+            self._by_tag.setdefault(tag, set()).add(name)
+        self._openai_tools_cache.clear()
 
         logger.debug(f"Registered tool: {name} (category: {category})")
         return tool
 
+    def register_many(self, specs: Iterable[Dict[str, Any]]) -> List[Tool]:
+        """
+        Register several tools at once.
+
+        Names are checked up front, so a duplicate leaves the registry
+        unchanged instead of half-populated.
+
+        Args:
+            specs: Keyword-argument dicts for register(), each with at
+                least "name" and "func"
+
+        Returns:
+            The registered Tool instances, in order
+
+        Raises:
+            ValueError: If a name is already registered or repeated in specs
+        """
+        specs = list(specs)
+        seen = set()
+        for spec in specs:
+            name = spec["name"]
+            if name in self._tools or name in seen:
+                raise ValueError(f"Tool '{name}' already registered")
+            seen.add(name)
+        return [self.register(**spec) for spec in specs]
+
     def _infer_parameters(self, func: Callable) -> Dict[str, Any]:
         """
         Infer JSON schema parameters from function signature.
@@ -168,34 +291,17 @@ class ToolRegistry:
         Returns:
             JSON schema dictionary
         """
-        sig = inspect.signature(func)
+        parameters, hints = _introspect(func)
         properties: Dict[str, Any] = {}
         required: List[str] = []
 
-        # Try to get type hints
-        try:
-            hints = get_type_hints(func)
-        except Exception:
-            hints = {}
-
-        for param_name, param in sig.parameters.items():
+        for param in parameters:
+            param_name = param.name
             if param_name in ('self', 'cls'):
                 continue
 
             # Determine type from hint or default
-            param_type = "string"  # default
-            if param_name in hints:
-                hint = hints[param_name]
-                if hint == int:
-                    param_type = "integer"
-                elif hint == float:
-                    param_type = "number"
-                elif hint == bool:
-                    param_type = "boolean"
-                elif hint == list or (hasattr(hint, '__origin__') and hint.__origin__ == list):
-                    param_type = "array"
-                elif hint == dict or (hasattr(hint, '__origin__') and hint.__origin__ == dict):
-                    param_type = "object"
+            param_type = _json_type(hints[param_name]) if param_name in hints else "string"
 
             properties[param_name] = {"type": param_type}
 
@@ -217,6 +323,22 @@ class ToolRegistry:
         """Get a tool by name."""
         return self._tools.get(name)
 
+    def _select(
+        self,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        enabled_only: bool = True,
+    ) -> List[Tool]:
+        """Return matching tools in registration order, using the indexes."""
+        names: Iterable[str] = self._categories.get(category, ()) if category else self._tools
+        if tags:
+            tagged = set().union(*(self._by_tag.get(tag, ()) for tag in tags))
+            names = [name for name in names if name in tagged]
+        tools = self._tools
+        if enabled_only:
+            return [tools[name] for name in names if tools[name].enabled]
+        return [tools[name] for name in names]
+
     def get_openai_tools(
         self,
         category: Optional[str] = None,
@@ -232,24 +354,24 @@ class ToolRegistry:
             enabled_only: Only include enabled tools
 
         Returns:
-            List of tool schemas in OpenAI format
+            List of tool schemas in OpenAI format. The list is memoized until
+            a tool is registered or enabled/disabled and shared between
+            callers, so it must not be mutated.
         """
-        tools = []
-        for tool in self._tools.values():
-            # Filter by enabled status
-            if enabled_only and not tool.enabled:
-                continue
-
-            # Filter by category
-            if category and tool.category != category:
-                continue
-
-            # Filter by tags
-            if tags and not any(tag in tool.tags for tag in tags):
-                continue
-
-            tools.append(tool.to_openai_schema())
-
+        key = (category, frozenset(tags or ()), enabled_only)
+        cached = self._openai_tools_cache.get(key)
+        if cached is not None:
+            candidates, flags, tools = cached
+            if not enabled_only or tuple(tool.enabled for tool in candidates) == flags:
+                return tools
+        candidates = self._select(category, tags, enabled_only=False)
+        flags = tuple(tool.enabled for tool in candidates)
+        tools = [
+            tool.to_openai_schema()
+            for tool in candidates
+            if tool.enabled or not enabled_only
+        ]
+        self._openai_tools_cache[key] = (candidates, flags, tools)
         return tools
 
     def get_tool_map(
@@ -267,15 +389,27 @@ class ToolRegistry:
         Returns:
             Dictionary mapping tool names to functions
         """
-        tool_map = {}
-        for name, tool in self._tools.items():
-            if enabled_only and not tool.enabled:
-                continue
-            if category and tool.category != category:
-                continue
-            tool_map[name] = tool.func
+        return {tool.name: tool.func for tool in self._select(category, None, enabled_only)}
+
+    def get_tools(
+        self,
+        category: Optional[str] = None,
+        enabled_only: bool = True,
+    ) -> Dict[str, Tool]:
+        """
+        Get mapping of tool names to Tool objects.
+
+        Unlike get_tool_map(), the values carry registration metadata, so
+        ParallelToolExecutor can honor per-tool settings.
 
-        return tool_map
+        Args:
+            category: Filter by category (None = all)
+            enabled_only: Only include enabled tools
+
+        Returns:
+            Dictionary mapping tool names to Tool objects
+        """
+        return {tool.name: tool for tool in self._select(category, None, enabled_only)}
 
     def enable(self, name: str) -> None:
         """Enable a tool."""
@@ -303,6 +437,8 @@ class ToolRegistry:
         """Clear all registered tools."""
         self._tools.clear()
         self._categories.clear()
+        self._by_tag.clear()
+        self._openai_tools_cache.clear()
 
     def __len__(self) -> int:
         """Return number of registered tools."""
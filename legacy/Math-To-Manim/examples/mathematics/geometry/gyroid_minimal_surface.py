@@ -13,6 +13,10 @@ Mathematical Background:
 - Schwarz P: cos(x) + cos(y) + cos(z) = 0
 """
 
+import os
+import tempfile
+from pathlib import Path
+
 from manim import *
 import numpy as np
 from scipy import ndimage
@@ -25,6 +29,96 @@ except ImportError:
     HAS_SKIMAGE = False
     print("Warning: scikit-image not found. Using parametric approximation.")
 
+# Marching-cubes meshes are cached here between renders, next to this file
+# so the cache does not depend on the directory manim is run from
+ISO_CACHE_DIR = Path(__file__).resolve().parent / ".iso_cache"
+
+
+def compute_isosurface(t, resolution, bounds):
+    """
+    Extract the zero isosurface of the gyroid/Schwarz P field.
+
+    t morphs between the gyroid (0) and Schwarz P (1). Returns (verts,
+    faces, normals) with verts in world coordinates. Results are cached as
+    .npz files in ISO_CACHE_DIR, keyed by t rounded to 3 decimals, so
+    re-rendering a scene skips the field evaluation and marching cubes.
+    """
+    t = float(t)
+    cache_path = ISO_CACHE_DIR / f"iso_t{t:.3f}_r{resolution}_b{bounds:.6f}.npz"
+    if cache_path.exists():
+        with np.load(cache_path) as cached:
+            return cached["verts"], cached["faces"], cached["normals"]
+
+    # The field is separable, so sin/cos are only evaluated along each
+    # axis and broadcast; laid out as np.meshgrid's default "xy" indexing
+    # (y on axis 0, x on axis 1, z on axis 2)
+    axis = np.linspace(-bounds, bounds, resolution)
+    sin_axis, cos_axis = np.sin(axis), np.cos(axis)
+    sx, cx = sin_axis[np.newaxis, :, np.newaxis], cos_axis[np.newaxis, :, np.newaxis]
+    sy, cy = sin_axis[:, np.newaxis, np.newaxis], cos_axis[:, np.newaxis, np.newaxis]
+    sz, cz = sin_axis[np.newaxis, np.newaxis, :], cos_axis[np.newaxis, np.newaxis, :]
+
+    # Evaluate implicit function
+    if t == 0:
+        # Pure gyroid
+        F = sx * cy + sy * cz + sz * cx
+    elif t == 1:
+        # Pure Schwarz P
+        F = cx + cy + cz
+    else:
+        # Interpolated
+        G = sx * cy + sy * cz + sz * cx
+        P = cx + cy + cz
+        F = (1 - t) * G + t * P
+
+    # Extract isosurface
+    verts, faces, normals, values = marching_cubes(F, level=0)
+
+    # Scale vertices to world coordinates
+    scale = 2 * bounds / resolution
+    verts = verts * scale - bounds
+
+    # Write to a temp file first so a concurrent render never reads a
+    # partial cache entry
+    ISO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=ISO_CACHE_DIR, suffix=".tmp", delete=False) as tmp:
+        np.savez_compressed(tmp, verts=verts, faces=faces, normals=normals)
+    os.replace(tmp.name, cache_path)
+    return verts, faces, normals
+
+
+def grid_surface_func(solve, u_range, v_range, resolution):
+    """
+    Precompute a Surface function on every (u, v) point Manim samples.
+
+    Surface evaluates its function at the corners and the 1/3, 2/3 Bezier
+    handles of each face, which all lie on a grid three times finer than
+    the face resolution. ``solve(U, V)`` is called once on that whole grid
+    with NumPy arrays and must return an array of shape (3, *U.shape);
+    the returned function looks points up in the table and only calls
+    ``solve`` on scalars for points off the grid.
+    """
+    n_u = 3 * resolution[0] + 1
+    n_v = 3 * resolution[1] + 1
+    U, V = np.meshgrid(
+        np.linspace(*u_range, n_u),
+        np.linspace(*v_range, n_v),
+        indexing="ij",
+    )
+    table = solve(U, V)
+    du = (u_range[1] - u_range[0]) / (n_u - 1)
+    dv = (v_range[1] - v_range[0]) / (n_v - 1)
+
+    def func(u, v):
+        i = (u - u_range[0]) / du
+        j = (v - v_range[0]) / dv
+        ri, rj = int(round(i)), int(round(j))
+        if 0 <= ri < n_u and 0 <= rj < n_v and abs(i - ri) < 1e-6 and abs(j - rj) < 1e-6:
+            return table[:, ri, rj]
+        return solve(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+
+    return func
+
 
 class GyroidMinimalSurface(ThreeDScene):
     """
@@ -146,49 +240,56 @@ class GyroidMinimalSurface(ThreeDScene):
 
     def create_gyroid_patch(self, offset, t, scale):
         """Create a single patch of the gyroid surface."""
-        def gyroid_func(x, y, z):
+        # The implicit functions take precomputed sines and cosines so the
+        # Newton loop only re-evaluates the z terms
+        def gyroid_func(sx, cx, sy, cy, sz, cz):
             """Gyroid implicit function."""
-            return np.sin(x) * np.cos(y) + np.sin(y) * np.cos(z) + np.sin(z) * np.cos(x)
+            return sx * cy + sy * cz + sz * cx
 
-        def schwarz_p_func(x, y, z):
+        def schwarz_p_func(cx, cy, cz):
             """Schwarz P implicit function."""
-            return np.cos(x) + np.cos(y) + np.cos(z)
+            return cx + cy + cz
 
-        def mixed_func(x, y, z, t):
+        def mixed_func(sx, cx, sy, cy, sz, cz, t):
             """Interpolate between gyroid and Schwarz P."""
-            g = gyroid_func(x, y, z)
-            p = schwarz_p_func(x, y, z)
+            g = gyroid_func(sx, cx, sy, cy, sz, cz)
+            p = schwarz_p_func(cx, cy, cz)
             return (1 - t) * g + t * p
 
         # Create parametric surface approximation
         # We use one of the two channels as a surface
-        def surface_func(u, v):
+        def solve(u, v):
             # Map u, v to a surface point on or near the gyroid
             # Use a modified parametrization
             x = u + offset[0]
             y = v + offset[1]
+            sx, cx, sy, cy = np.sin(x), np.cos(x), np.sin(y), np.cos(y)
 
-            # Solve for z approximately (Newton's method for one iteration)
-            z_init = offset[2]
+            # Solve for z approximately (Newton's method), for all points at
+            # once; a point stops updating once its derivative vanishes
+            z = np.full_like(x, offset[2])
+            active = np.ones_like(x, dtype=bool)
             for _ in range(5):
-                val = mixed_func(x, y, z_init, t)
+                sz, cz = np.sin(z), np.cos(z)
+                val = mixed_func(sx, cx, sy, cy, sz, cz, t)
                 # Derivative with respect to z
-                dz = -np.sin(z_init) * np.cos(x) + np.cos(z_init) * np.sin(y)
+                dz = -sz * cx + cz * sy
                 if t > 0:
-                    dz = (1 - t) * dz - t * np.sin(z_init)
-                if abs(dz) > 1e-6:
-                    z_init = z_init - val / dz
-                else:
-                    break
+                    dz = (1 - t) * dz - t * sz
+                active = active & (np.abs(dz) > 1e-6)
+                z = np.where(active, z - val / np.where(active, dz, 1.0), z)
 
-            return scale * np.array([x, y, z_init])
+            return scale * np.stack([x, y, z])
 
+        u_range = [-PI/2, PI/2]
+        v_range = [-PI/2, PI/2]
+        resolution = (15, 15)
         try:
             surface = Surface(
-                surface_func,
-                u_range=[-PI/2, PI/2],
-                v_range=[-PI/2, PI/2],
-                resolution=(15, 15),
+                grid_surface_func(solve, u_range, v_range, resolution),
+                u_range=u_range,
+                v_range=v_range,
+                resolution=resolution,
                 fill_opacity=0.9,
                 stroke_width=0.5,
                 stroke_color=WHITE,
@@ -209,31 +310,7 @@ class GyroidMinimalSurface(ThreeDScene):
         if not HAS_SKIMAGE:
             return self.create_gyroid_surface(t)
 
-        # Create 3D grid
-        x = np.linspace(-bounds, bounds, resolution)
-        y = np.linspace(-bounds, bounds, resolution)
-        z = np.linspace(-bounds, bounds, resolution)
-        X, Y, Z = np.meshgrid(x, y, z)
-
-        # Evaluate implicit function
-        if t == 0:
-            # Pure gyroid
-            F = np.sin(X) * np.cos(Y) + np.sin(Y) * np.cos(Z) + np.sin(Z) * np.cos(X)
-        elif t == 1:
-            # Pure Schwarz P
-            F = np.cos(X) + np.cos(Y) + np.cos(Z)
-        else:
-            # Interpolated
-            G = np.sin(X) * np.cos(Y) + np.sin(Y) * np.cos(Z) + np.sin(Z) * np.cos(X)
-            P = np.cos(X) + np.cos(Y) + np.cos(Z)
-            F = (1 - t) * G + t * P
-
-        # Extract isosurface
-        verts, faces, normals, values = marching_cubes(F, level=0)
-
-        # Scale vertices to world coordinates
-        scale = 2 * bounds / resolution
-        verts = verts * scale - bounds
+        verts, faces, normals = compute_isosurface(t, resolution, bounds)
 
         # Create Manim mesh
         return self.verts_faces_to_surface(verts, faces, normals, t)
@@ -242,31 +319,30 @@ class GyroidMinimalSurface(ThreeDScene):
         """Convert vertices and faces to Manim surface group."""
         surfaces = VGroup()
 
+        # Sample every 3rd face for performance
+        triangles = verts[faces[::3]]
+
+        # Color by mean curvature (approximated by normal direction),
+        # computed for every triangle at once
+        centers = triangles.mean(axis=1)
+        curvature_proxy = np.sin(centers[:, 0]) + np.cos(centers[:, 1]) + np.sin(centers[:, 2])
+
+        # Map to color (linear RGB blend, as interpolate_color does)
+        color_t = (curvature_proxy + 3) / 6  # Normalize to 0-1
+        start = ManimColor(self.VIOLET_DEEP).to_rgb()
+        end = ManimColor(self.GOLD).to_rgb()
+        colors = start + color_t[:, np.newaxis] * (end - start)
+
         # Create triangular patches
-        for face in faces[::3]:  # Sample every 3rd face for performance
+        for (v0, v1, v2), color in zip(triangles, colors):
             try:
-                v0, v1, v2 = verts[face[0]], verts[face[1]], verts[face[2]]
-
-                # Create triangle
                 triangle = Polygon(
                     v0, v1, v2,
+                    fill_color=ManimColor(color),
                     fill_opacity=0.85,
                     stroke_width=0.2,
                     stroke_color=WHITE,
                 )
-
-                # Color by mean curvature (approximated by normal direction)
-                center = (v0 + v1 + v2) / 3
-                curvature_proxy = np.sin(center[0]) + np.cos(center[1]) + np.sin(center[2])
-
-                # Map to color
-                color_t = (curvature_proxy + 3) / 6  # Normalize to 0-1
-                color = interpolate_color(
-                    ManimColor(self.VIOLET_DEEP),
-                    ManimColor(self.GOLD),
-                    color_t
-                )
-                triangle.set_fill(color)
                 surfaces.add(triangle)
             except Exception:
                 continue
@@ -378,7 +454,7 @@ class GyroidMinimalSurface(ThreeDScene):
 
     def create_schwarz_p_patch(self, offset, scale):
         """Create a single patch of Schwarz P surface."""
-        def surface_func(u, v):
+        def solve(u, v):
             x = u + offset[0]
             y = v + offset[1]
 
@@ -388,14 +464,17 @@ class GyroidMinimalSurface(ThreeDScene):
             val = np.clip(val, -1, 1)
             z = np.arccos(val) + offset[2]
 
-            return scale * np.array([x, y, z])
+            return scale * np.stack([x, y, z])
 
+        u_range = [-PI/2, PI/2]
+        v_range = [-PI/2, PI/2]
+        resolution = (15, 15)
         try:
             surface = Surface(
-                surface_func,
-                u_range=[-PI/2, PI/2],
-                v_range=[-PI/2, PI/2],
-                resolution=(15, 15),
+                grid_surface_func(solve, u_range, v_range, resolution),
+                u_range=u_range,
+                v_range=v_range,
+                resolution=resolution,
                 fill_opacity=0.9,
                 stroke_width=0.5,
                 stroke_color=WHITE,
@@ -474,27 +553,33 @@ class GyroidSimple(ThreeDScene):
 
         # Create surface using implicit function sampling
         def create_patch(u_offset, v_offset):
-            def func(u, v):
+            def solve(u, v):
                 x = u + u_offset
                 y = v + v_offset
+                # x and y are fixed during the iteration; only z terms change
+                sx, cx, sy, cy = np.sin(x), np.cos(x), np.sin(y), np.cos(y)
 
                 # Approximate z from gyroid equation
                 # sin(x)cos(y) + sin(y)cos(z) + sin(z)cos(x) = 0
                 # Initial guess
-                z = 0.0
+                z = np.zeros_like(x)
                 for _ in range(8):
-                    f = np.sin(x) * np.cos(y) + np.sin(y) * np.cos(z) + np.sin(z) * np.cos(x)
-                    df = -np.sin(y) * np.sin(z) + np.cos(z) * np.cos(x)
-                    if abs(df) > 1e-8:
-                        z = z - f / df
+                    sz, cz = np.sin(z), np.cos(z)
+                    f = sx * cy + sy * cz + sz * cx
+                    df = -sy * sz + cz * cx
+                    step = np.abs(df) > 1e-8
+                    z = np.where(step, z - f / np.where(step, df, 1.0), z)
 
-                return np.array([x * scale / PI, y * scale / PI, z * scale / PI])
+                return np.stack([x * scale / PI, y * scale / PI, z * scale / PI])
 
+            u_range = [-PI * 0.9, PI * 0.9]
+            v_range = [-PI * 0.9, PI * 0.9]
+            resolution = (25, 25)
             return Surface(
-                func,
-                u_range=[-PI * 0.9, PI * 0.9],
-                v_range=[-PI * 0.9, PI * 0.9],
-                resolution=(25, 25),
+                grid_surface_func(solve, u_range, v_range, resolution),
+                u_range=u_range,
+                v_range=v_range,
+                resolution=resolution,
                 fill_opacity=0.85,
                 stroke_width=0.3,
                 stroke_color=WHITE,
@@ -85,8 +85,8 @@ def main():
     # repo root: tools/scripts/remove_emojis.py -> tools/scripts -> tools -> repo root
     project_root = Path(__file__).resolve().parents[2]
 
-    # File patterns to process
-    patterns = ['**/*.md', '**/*.py', '**/*.txt']
+    # File types to process
+    suffixes = {'.md', '.py', '.txt'}
 
     # Paths to skip (avoid binary/media and large generated outputs)
     skip_parts = {
@@ -111,14 +111,15 @@ def main():
 
     modified_files = []
 
-    for pattern in patterns:
-        for filepath in project_root.glob(pattern):
-            # Skip if in skip list or in skipped directories
-            if any(part in skip_parts for part in filepath.parts):
-                continue
-            if filepath.name in skip_files:
+    # One walk for all file types; skipped directories are pruned so
+    # .git, virtualenvs and media trees are never descended into
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [name for name in dirnames if name not in skip_parts]
+        for filename in filenames:
+            if filename in skip_files or os.path.splitext(filename)[1] not in suffixes:
                 continue
 
+            filepath = Path(dirpath) / filename
             if filepath.is_file():
                 if remove_emojis_from_file(filepath):
                     modified_files.append(filepath)
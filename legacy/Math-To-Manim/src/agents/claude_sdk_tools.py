@@ -12,9 +12,11 @@ from __future__ import annotations
 import json
 import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from claude_agent_sdk import tool
 
 # Cache for prerequisites (in-memory for now, can be Redis/DB later)
@@ -77,15 +79,9 @@ async def get_cached_prerequisites(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-@tool(
-    name="validate_latex",
-    description="Validate LaTeX syntax and check if it compiles correctly",
-    input_schema={"latex_code": str},
-)
-async def validate_latex(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate LaTeX code for syntax errors."""
-    latex_code = args["latex_code"]
-
+@lru_cache(maxsize=1024)
+def _check_latex(latex_code: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return (errors, warnings) for LaTeX code; pure, so results are memoized."""
     errors = []
     warnings = []
 
@@ -106,24 +102,33 @@ async def validate_latex(args: Dict[str, Any]) -> Dict[str, Any]:
         if char in latex_code and f"\\{char}" not in latex_code:
             warnings.append(f"Unescaped special character: {char}")
 
-    # Check for balanced braces
-    brace_count = 0
-    for char in latex_code:
-        if char == "{":
-            brace_count += 1
-        elif char == "}":
-            brace_count -= 1
-        if brace_count < 0:
-            errors.append("Unmatched closing brace }")
-            break
+    # Check for balanced braces: the running depth is a cumulative sum of
+    # +1/-1 steps, computed over the UTF-8 bytes (braces are single bytes)
+    codes = np.frombuffer(latex_code.encode("utf-8"), dtype=np.uint8)
+    depth = np.cumsum((codes == 0x7B).astype(np.int64) - (codes == 0x7D))
+    if depth.size and depth.min() < 0:
+        errors.append("Unmatched closing brace }")
+    elif depth.size and depth[-1] > 0:
+        errors.append(f"Unclosed braces: {int(depth[-1])} opening brace(s) without closing")
+
+    return tuple(errors), tuple(warnings)
+
 
-    if brace_count > 0:
-        errors.append(f"Unclosed braces: {brace_count} opening brace(s) without closing")
+@tool(
+    name="validate_latex",
+    description="Validate LaTeX syntax and check if it compiles correctly",
+    input_schema={"latex_code": str},
+)
+async def validate_latex(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate LaTeX code for syntax errors."""
+    latex_code = args["latex_code"]
+
+    errors, warnings = _check_latex(latex_code)
 
     result = {
         "valid": len(errors) == 0,
-        "errors": errors,
-        "warnings": warnings,
+        "errors": list(errors),
+        "warnings": list(warnings),
         "latex_code": latex_code
     }
 
@@ -1,17 +1,33 @@
+import hashlib
+import json
 import os
+import re
+import tempfile
+from pathlib import Path
 from dotenv import load_dotenv
 import gradio as gr
-from openai import OpenAI
+from openai import OpenAI, Timeout
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize OpenAI client with DeepSeek base URL
+# Initialize OpenAI client with DeepSeek base URL. Connecting fails fast,
+# while reads allow long gaps between reasoning tokens; the SDK retries
+# timeouts, connection errors, 429s and 5xx responses with exponential
+# backoff before a stream starts
 client = OpenAI(
     api_key=os.getenv("DEEPSEEK_API_KEY"),
-    base_url="https://api.deepseek.com"
+    base_url="https://api.deepseek.com",
+    timeout=Timeout(connect=5.0, read=120.0, write=5.0, pool=5.0),
+    max_retries=4
 )
 
+MODEL = "deepseek-reasoner"  # Latest: deepseek-r1 or deepseek-chat for stable production
+
+# Set LLM_CACHE_DIR to store completed responses and replay them for
+# identical requests; unset (the default), every request reaches the API
+LLM_CACHE_DIR = Path(os.environ["LLM_CACHE_DIR"]) if os.getenv("LLM_CACHE_DIR") else None
+
 # Initialize smolagent (commented out until smolagents is available)
 # smolagent = MathToManimAgent()
 
@@ -19,30 +35,32 @@ client = OpenAI(
 if not os.getenv("DEEPSEEK_API_KEY"):
     raise ValueError("DEEPSEEK_API_KEY environment variable is not set. Please check your .env file.")
 
+# A single $ not escaped with a backslash
+INLINE_DOLLAR_RE = re.compile(r'(?<!\\)\$')
+
 def format_latex(text):
     """Format inline LaTeX expressions for proper rendering in Gradio."""
-    # Replace single dollar signs with double for better display
-    lines = text.split('\n')
-    formatted_lines = []
-    
-    for line in lines:
-        # Skip lines that already have double dollars
-        if '$$' in line:
-            formatted_lines.append(line)
-            continue
-            
-        # Format single dollar expressions
-        in_math = False
-        new_line = ''
-        for i, char in enumerate(line):
-            if char == '$' and (i == 0 or line[i-1] != '\\'):
-                in_math = not in_math
-                new_line += '$$' if in_math else '$$'
-            else:
-                new_line += char
-        formatted_lines.append(new_line)
-    
-    return '\n'.join(formatted_lines)
+    # Replace single dollar signs with double for better display, skipping
+    # lines that already have double dollars
+    return '\n'.join(
+        line if '$$' in line else INLINE_DOLLAR_RE.sub('$$', line)
+        for line in text.split('\n')
+    )
+
+class StreamingLatexFormatter:
+    """Apply format_latex to streamed text, formatting each line once."""
+
+    def __init__(self):
+        self._lines = []
+        self._partial = ''
+
+    def append(self, text):
+        *complete, self._partial = (self._partial + text).split('\n')
+        self._lines.extend(format_latex(line) for line in complete)
+
+    @property
+    def text(self):
+        return '\n'.join([*self._lines, format_latex(self._partial)])
 
 def process_simple_prompt(simple_prompt):
     """
@@ -65,6 +83,45 @@ Ensure all symbols are defined when they first appear, and use consistent notati
 
 End with a summary that reinforces the key insights from the animation."""
 
+def _cache_key(model, messages):
+    """Hash the model and conversation into a cache key."""
+    material = model + json.dumps(messages, sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+def stream_completion(messages, model=MODEL):
+    """
+    Yield (reasoning, content) deltas for a conversation.
+
+    When LLM_CACHE_DIR is set, identical requests are replayed delta by
+    delta from it, so the chat still streams. A response is only cached once
+    the stream has completed.
+    """
+    cache_path = LLM_CACHE_DIR / f"{_cache_key(model, messages)}.json" if LLM_CACHE_DIR else None
+    if cache_path is not None and cache_path.exists():
+        for reasoning_delta, content_delta in json.loads(cache_path.read_text(encoding="utf-8")):
+            yield reasoning_delta, content_delta
+        return
+    
+    deltas = []
+    for chunk in client.chat.completions.create(model=model, messages=messages, stream=True):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        reasoning_delta = getattr(delta, "reasoning_content", None)
+        if not (reasoning_delta or delta.content):
+            continue
+        deltas.append((reasoning_delta, delta.content))
+        yield reasoning_delta, delta.content
+    
+    if cache_path is None:
+        return
+    # Write to a unique temp file first so concurrent sessions never see a
+    # partial entry
+    LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=LLM_CACHE_DIR, suffix=".tmp", delete=False) as tmp:
+        json.dump(deltas, tmp)
+    os.replace(tmp.name, cache_path)
+
 def chat_with_deepseek(message, history, use_smolagent=False):
     # Process with smolagent if requested
     if use_smolagent:
@@ -78,21 +135,25 @@ def chat_with_deepseek(message, history, use_smolagent=False):
             messages.append({"role": "assistant", "content": assistant})
     messages.append({"role": "user", "content": message})
     
-    # Call the DeepSeek API
+    # Stream the DeepSeek response so Gradio paints tokens as they arrive
     try:
-        response = client.chat.completions.create(
-            model="deepseek-reasoner",  # Latest: deepseek-r1 or deepseek-chat for stable production
-            messages=messages
-        )
-        
-        # Get both reasoning and final content
-        reasoning = format_latex(response.choices[0].message.reasoning_content)
-        answer = format_latex(response.choices[0].message.content)
-        
-        # Return both, separated by a clear delimiter
-        return f" Reasoning:\n{reasoning}\n\n[NOTE] Answer:\n{answer}"
+        reasoning = StreamingLatexFormatter()
+        answer = StreamingLatexFormatter()
+        has_answer = False
+        for reasoning_delta, content_delta in stream_completion(messages):
+            if reasoning_delta:
+                reasoning.append(reasoning_delta)
+            if content_delta:
+                answer.append(content_delta)
+                has_answer = True
+            
+            # Yield both so far, separated by a clear delimiter
+            partial = f" Reasoning:\n{reasoning.text}"
+            if has_answer:
+                partial += f"\n\n[NOTE] Answer:\n{answer.text}"
+            yield partial
     except Exception as e:
-        return f"Error: {str(e)}"
+        yield f"Error: {str(e)}"
 
 # Create Gradio interface with tabs for different modes
 with gr.Blocks(theme="soft") as iface:
@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures for Math-To-Manim tests."""
 
+import importlib.util
 import os
 import sys
 
@@ -13,6 +14,27 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# KimiK2.5Swarm is not a valid package name and its subpackage names (tools,
+# agents, models) clash with this project's, so they are loaded under aliases
+swarm_root = os.path.join(project_root, "KimiK2.5Swarm")
+
+
+def load_swarm_package(name):
+    """Import KimiK2.5Swarm/<name> as the package ``kimi_swarm_<name>``."""
+    alias = f"kimi_swarm_{name}"
+    if alias in sys.modules:
+        return sys.modules[alias]
+    package_dir = os.path.join(swarm_root, name)
+    spec = importlib.util.spec_from_file_location(
+        alias,
+        os.path.join(package_dir, "__init__.py"),
+        submodule_search_locations=[package_dir],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = package
+    spec.loader.exec_module(package)
+    return package
+
 
 def pytest_configure(config):
     """Register custom markers."""
@@ -50,3 +72,15 @@ def mock_analysis_result():
         "level": "intermediate",
         "goal": "Understand quantum mechanical principles",
     }
+
+
+@pytest.fixture(scope="session")
+def swarm_tools():
+    """The KimiK2.5Swarm tools package."""
+    return load_swarm_package("tools")
+
+
+@pytest.fixture(scope="session")
+def swarm_models():
+    """The KimiK2.5Swarm models package."""
+    return load_swarm_package("models")
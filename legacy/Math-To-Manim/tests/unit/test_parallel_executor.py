@@ -0,0 +1,186 @@
+"""Unit tests for the KimiK2.5Swarm ParallelToolExecutor."""
+
+import asyncio
+import json
+
+import pytest
+
+
+def make_call(call_id, name, arguments):
+    return {"id": call_id, "function": {"name": name, "arguments": json.dumps(arguments)}}
+
+
+class TestResultCache:
+    """Tests for which calls the executor may reuse."""
+
+    def test_side_effecting_callable_runs_on_every_batch(self, swarm_tools):
+        sent = []
+
+        def send(msg):
+            sent.append(msg)
+            return len(sent)
+
+        async def run():
+            async with swarm_tools.ParallelToolExecutor() as executor:
+                for call_id in ("1", "2", "3"):
+                    await executor.execute_batch(
+                        [make_call(call_id, "send", {"msg": "hi"})], {"send": send}
+                    )
+
+        asyncio.run(run())
+        assert sent == ["hi", "hi", "hi"]
+
+    def test_cacheable_tool_reuses_result_when_cache_enabled(self, swarm_tools):
+        calls = []
+
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        tool = swarm_tools.Tool(
+            name="square", func=square, description="", parameters={}, cacheable=True
+        )
+
+        async def run():
+            async with swarm_tools.ParallelToolExecutor(cache_size=8) as executor:
+                await executor.execute_batch([make_call("1", "square", {"x": 3})], {"square": tool})
+                return await executor.execute_batch(
+                    [make_call("2", "square", {"x": 3})], {"square": tool}
+                )
+
+        second = asyncio.run(run())
+        assert calls == [3]
+        assert second.cache_hits == 1
+        assert second.results[0].result == 9
+        assert second.results[0].tool_call_id == "2"
+
+
+class TestCallSharing:
+    """Tests for identical calls sharing one in-flight execution."""
+
+    def test_sharer_runs_the_call_when_owner_is_cancelled(self, swarm_tools):
+        started = []
+
+        async def slow(x):
+            started.append(x)
+            await asyncio.sleep(0.05)
+            return x
+
+        tool = swarm_tools.Tool(
+            name="slow", func=slow, description="", parameters={}, cacheable=True
+        )
+
+        async def run():
+            async with swarm_tools.ParallelToolExecutor() as executor:
+                owner = asyncio.create_task(
+                    executor.execute_batch([make_call("1", "slow", {"x": 7})], {"slow": tool})
+                )
+                await asyncio.sleep(0.01)
+                sharer = asyncio.create_task(
+                    executor.execute_batch([make_call("2", "slow", {"x": 7})], {"slow": tool})
+                )
+                await asyncio.sleep(0.01)
+                owner.cancel()
+                return await sharer
+
+        result = asyncio.run(run())
+        assert started == [7, 7]
+        assert result.all_successful
+        assert result.results[0].result == 7
+        assert result.results[0].tool_call_id == "2"
+
+
+class TestArguments:
+    """Tests for how parsed arguments reach tools."""
+
+    def test_mutating_arguments_does_not_leak_into_later_calls(self, swarm_tools):
+        def tag(items):
+            items.append("seen")
+            return items
+
+        async def run():
+            async with swarm_tools.ParallelToolExecutor() as executor:
+                calls = [make_call(str(i), "tag", {"items": ["a"]}) for i in range(2)]
+                first = await executor.execute_batch(calls[:1], {"tag": tag})
+                second = await executor.execute_batch(calls[1:], {"tag": tag})
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first.results[0].result == ["a", "seen"]
+        assert second.results[0].result == ["a", "seen"]
+
+
+class TestLifecycle:
+    """Tests for closing the executor and mixing sync and async use."""
+
+    def test_batches_after_close_raise(self, swarm_tools):
+        executor = swarm_tools.ParallelToolExecutor()
+        executor.close()
+        calls = [make_call("1", "add", {"a": 1, "b": 2})]
+
+        with pytest.raises(RuntimeError, match="closed"):
+            executor.execute_batch_sync(calls, {"add": lambda a, b: a + b})
+        with pytest.raises(RuntimeError, match="closed"):
+            asyncio.run(executor.execute_batch(calls, {"add": lambda a, b: a + b}))
+
+    def test_sync_and_async_batches_can_be_mixed(self, swarm_tools):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        tool_map = {"add": add}
+        executor = swarm_tools.ParallelToolExecutor(max_concurrent=1)
+        try:
+            first = executor.execute_batch_sync(
+                [make_call(str(i), "add", {"a": i, "b": 1}) for i in range(3)], tool_map
+            )
+            second = asyncio.run(executor.execute_batch(
+                [make_call(str(i), "add", {"a": i, "b": 1}) for i in range(3)], tool_map
+            ))
+        finally:
+            executor.close()
+
+        assert [r.result for r in first.results] == [1, 2, 3]
+        assert [r.result for r in second.results] == [1, 2, 3]
+        assert second.all_successful
+
+
+class TestCacheBackend:
+    """Tests for the persistent second-tier cache."""
+
+    def test_backend_io_runs_off_the_event_loop(self, swarm_tools):
+        loop_threads = []
+
+        class RecordingBackend(swarm_tools.InMemoryBackend):
+            def get(self, key):
+                loop_threads.append(self._on_loop())
+                return super().get(key)
+
+            def set(self, key, value, ttl=None):
+                loop_threads.append(self._on_loop())
+                super().set(key, value, ttl)
+
+            @staticmethod
+            def _on_loop():
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return False
+                return True
+
+        tool = swarm_tools.Tool(
+            name="square", func=lambda x: x * x, description="", parameters={}, cacheable=True
+        )
+        backend = RecordingBackend()
+
+        async def run():
+            async with swarm_tools.ParallelToolExecutor(cache_backend=backend) as executor:
+                await executor.execute_batch([make_call("1", "square", {"x": 3})], {"square": tool})
+                return await executor.execute_batch(
+                    [make_call("2", "square", {"x": 3})], {"square": tool}
+                )
+
+        second = asyncio.run(run())
+        assert second.cache_hits == 1
+        assert second.results[0].result == 9
+        assert loop_threads and not any(loop_threads)
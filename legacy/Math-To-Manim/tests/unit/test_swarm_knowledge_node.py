@@ -0,0 +1,37 @@
+"""Unit tests for the KimiK2.5Swarm KnowledgeNode traversal helpers."""
+
+
+class TestTraversal:
+    """Tests for whole-tree queries on a mutable KnowledgeNode."""
+
+    def test_counts_follow_added_prerequisites(self, swarm_models):
+        KnowledgeNode = swarm_models.KnowledgeNode
+        root = KnowledgeNode(concept="momentum", depth=0, is_foundation=False)
+        assert root.count_nodes() == 1
+        assert list(root.group_by_depth()) == [0]
+
+        root.prerequisites.append(KnowledgeNode(concept="velocity", depth=1, is_foundation=True))
+
+        assert root.count_nodes() == 2
+        assert [node.concept for node in root.group_by_depth()[1]] == ["velocity"]
+
+    def test_interned_diamond_counts_shared_node_once(self, swarm_models):
+        mass = {"concept": "mass", "depth": 2, "is_foundation": True}
+        data = {
+            "concept": "kinetic energy",
+            "depth": 0,
+            "is_foundation": False,
+            "prerequisites": [
+                {"concept": c, "depth": 1, "is_foundation": False, "prerequisites": [mass]}
+                for c in ("momentum", "inertia")
+            ],
+        }
+        root = swarm_models.KnowledgeNode.from_dict(data, intern=True)
+        assert root.prerequisites[0].prerequisites[0] is root.prerequisites[1].prerequisites[0]
+
+        groups = root.group_by_depth()
+        assert root.count_nodes() == 4
+        assert sum(len(nodes) for nodes in groups.values()) == 4
+        assert root.collect_all_concepts() == ["kinetic energy", "momentum", "mass", "inertia"]
+        assert root.get_nodes_at_depth(2) == groups[2]
+        assert swarm_models.KnowledgeTreeSoA.from_root(root).count_nodes() == 4
@@ -0,0 +1,29 @@
+"""Unit tests for the KimiK2.5Swarm ToolRegistry."""
+
+
+class TestEnabled:
+    """Tests for hiding and showing registered tools."""
+
+    def test_setting_enabled_directly_hides_the_tool(self, swarm_tools):
+        registry = swarm_tools.ToolRegistry()
+        tool = registry.register("echo", lambda x: x, description="Echo")
+        assert [t["function"]["name"] for t in registry.get_openai_tools()] == ["echo"]
+
+        tool.enabled = False
+        assert registry.get_openai_tools() == []
+        assert registry.get_tool_map() == {}
+        assert registry.get_tools() == {}
+
+        tool.enabled = True
+        assert [t["function"]["name"] for t in registry.get_openai_tools()] == ["echo"]
+        assert list(registry.get_tools()) == ["echo"]
+
+    def test_disable_and_enable_update_openai_tools(self, swarm_tools):
+        registry = swarm_tools.ToolRegistry()
+        registry.register("echo", lambda x: x, description="Echo")
+        registry.get_openai_tools()
+
+        registry.disable("echo")
+        assert registry.get_openai_tools() == []
+        registry.enable("echo")
+        assert len(registry.get_openai_tools()) == 1
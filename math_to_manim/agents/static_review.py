@@ -6,7 +6,7 @@ from pathlib import Path
 
 from math_to_manim.agents.base import StageAgent
 from math_to_manim.schemas import GeneratedCode, ValidationIssue, ValidationReport
-from math_to_manim.tools import discover_scene_classes_in_file, validate_python_source
+from math_to_manim.tools import discover_scene_classes, validate_python_source
 
 
 class StaticReviewAgent(StageAgent[tuple[GeneratedCode, Path], ValidationReport]):
@@ -28,7 +28,8 @@ class StaticReviewAgent(StageAgent[tuple[GeneratedCode, Path], ValidationReport]
         scenes = []
         scene_found = False
         if ast_report.ok:
-            scenes = [scene.name for scene in discover_scene_classes_in_file(file_path, require_construct=True)]
+            discovered = discover_scene_classes(generated.code, tree=ast_report.tree, require_construct=True)
+            scenes = [scene.name for scene in discovered]
             scene_found = generated.scene_name in scenes
             if not scene_found:
                 schema_issues.append(
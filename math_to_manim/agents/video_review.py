@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from math_to_manim.agents.base import StageAgent
@@ -10,6 +11,11 @@ from math_to_manim.rendering import extract_frame, make_contact_sheet, probe_vid
 from math_to_manim.review import score_video_file, score_video_probe
 
 
+# Sample frames and the contact sheet are independent ffmpeg runs; this many
+# run at once.
+FRAME_EXTRACTION_WORKERS = 4
+
+
 class VideoReviewAgent(StageAgent[RenderResult, VideoReviewReport]):
     name = "video_review"
 
@@ -89,19 +95,30 @@ def _write_draft_review_handoff(video_path: Path, probe: object, score_observati
 
     duration = getattr(probe, "duration_seconds", None)
     timestamps = _sample_timestamps(duration)
+    frame_jobs = [
+        (frame_dir / f"frame_{index:02d}_{int(timestamp):03d}s.png", timestamp)
+        for index, timestamp in enumerate(timestamps, start=1)
+    ]
+    contact_path = review_dir / "contact_sheet.png"
+    contact_interval = max((float(duration) / 9.0) if duration else 10.0, 1.0)
+
+    with ThreadPoolExecutor(max_workers=FRAME_EXTRACTION_WORKERS, thread_name_prefix="draft-review") as pool:
+        contact_future = pool.submit(
+            make_contact_sheet, video_path, contact_path, interval_seconds=contact_interval, columns=3, rows=3
+        )
+        frame_results = list(
+            pool.map(lambda job: extract_frame(video_path, job[0], timestamp_seconds=job[1]), frame_jobs)
+        )
+        contact = contact_future.result()
+
     frame_paths: list[str] = []
     asset_warnings: list[str] = []
-    for index, timestamp in enumerate(timestamps, start=1):
-        frame_path = frame_dir / f"frame_{index:02d}_{int(timestamp):03d}s.png"
-        result = extract_frame(video_path, frame_path, timestamp_seconds=timestamp)
+    for index, result in enumerate(frame_results, start=1):
         if result.ok and result.output_path:
             frame_paths.append(str(result.output_path))
         elif result.reason:
             asset_warnings.append(f"frame {index}: {result.reason}")
 
-    contact_path = review_dir / "contact_sheet.png"
-    contact_interval = max((float(duration) / 9.0) if duration else 10.0, 1.0)
-    contact = make_contact_sheet(video_path, contact_path, interval_seconds=contact_interval, columns=3, rows=3)
     contact_sheet = str(contact.output_path) if contact.ok and contact.output_path else None
     if not contact.ok and contact.reason:
         asset_warnings.append(f"contact sheet: {contact.reason}")
@@ -71,6 +71,7 @@ def build_parser() -> argparse.ArgumentParser:
     eval_suite.add_argument("--quality", default=None, help="Manim quality flag when --render is set")
     eval_suite.add_argument("--manim-command", default=None, help='Manim command override, e.g. "python -m manim"')
     eval_suite.add_argument("--model-backed", action="store_true", help="Use configured model stages instead of deterministic mode")
+    eval_suite.add_argument("--workers", type=int, default=1, help="Number of cases to run concurrently (default: 1)")
     eval_suite.add_argument("--json", action="store_true", help="Print the full eval result JSON")
 
     pi_export = subparsers.add_parser("pi-export-runs", help="Export run bundles as Prime Intellect repair-task JSONL")
@@ -177,7 +178,13 @@ def run_recover_render(args: argparse.Namespace) -> int:
 def run_eval_suite(args: argparse.Namespace) -> int:
     config = _config_from_args(args)
     config = RuntimeConfig(**{**config.__dict__, "deterministic": bool(not args.model_backed)})
-    result = run_prompt_suite(args.suite_path, config=config, runs_dir=args.runs_dir, render=args.render)
+    result = run_prompt_suite(
+        args.suite_path,
+        config=config,
+        runs_dir=args.runs_dir,
+        render=args.render,
+        max_workers=args.workers,
+    )
     if args.json:
         print(json.dumps(result.to_public_dict(), indent=2))
     else:
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import ast
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 import json
 from pathlib import Path
 import tempfile
 from typing import Any
 
-import yaml
-
 from math_to_manim.config import RuntimeConfig
 from math_to_manim.pipeline.runner import AnimationPipeline
 
@@ -109,6 +108,9 @@ class EvalSuiteResult:
 def load_prompt_suite(path: str | Path) -> dict[str, Any]:
     """Load and minimally validate a prompt eval suite YAML file."""
 
+    # Imported here so CLI commands other than eval-suite skip loading yaml.
+    import yaml
+
     suite_path = Path(path)
     payload = yaml.safe_load(suite_path.read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
@@ -125,8 +127,14 @@ def run_prompt_suite(
     config: RuntimeConfig | None = None,
     runs_dir: str | Path | None = None,
     render: bool = False,
+    max_workers: int = 1,
 ) -> EvalSuiteResult:
-    """Run each YAML prompt case through the local pipeline and score hard gates."""
+    """Run each YAML prompt case through the local pipeline and score hard gates.
+
+    With ``max_workers`` above 1, cases run concurrently on a thread pool;
+    each case spends most of its time waiting on model calls or Manim
+    subprocesses. Results keep the suite's case order either way.
+    """
 
     suite_file = Path(suite_path)
     suite = load_prompt_suite(suite_file)
@@ -136,10 +144,13 @@ def run_prompt_suite(
     base_config = config or RuntimeConfig.from_env()
     eval_config = RuntimeConfig(**{**base_config.__dict__, "runs_dir": suite_runs_dir})
 
-    case_results = [
-        _run_case(case, config=eval_config, render=render)
-        for case in suite["cases"]
-    ]
+    cases = suite["cases"]
+    workers = max(1, min(max_workers, len(cases)))
+    if workers == 1:
+        case_results = [_run_case(case, config=eval_config, render=render) for case in cases]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eval-case") as pool:
+            case_results = list(pool.map(lambda case: _run_case(case, config=eval_config, render=render), cases))
     return EvalSuiteResult(
         suite_id=str(suite.get("suite_id") or suite_file.stem),
         suite_path=str(suite_file),
@@ -208,7 +208,10 @@ def score_generated_code_completion(task: dict[str, Any], completion: str) -> Re
     ast_report = validate_python_source(generated.code)
     if ast_report.ok:
         components["python_parse"] = 1.0
-        scene_classes = [scene.name for scene in discover_scene_classes(generated.code, require_construct=True)]
+        scene_classes = [
+            scene.name
+            for scene in discover_scene_classes(generated.code, tree=ast_report.tree, require_construct=True)
+        ]
         if generated.scene_name in scene_classes and not errors:
             components["static_validation"] = 1.0
         elif generated.scene_name not in scene_classes:
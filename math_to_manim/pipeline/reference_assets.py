@@ -27,7 +27,7 @@ def store_reference_images(run_dir: Path, image_paths: list[str | Path] | None)
 
         digest = _sha256(source)
         destination = asset_dir / _asset_filename(source, digest=digest, index=index)
-        shutil.copy2(source, destination)
+        shutil.copyfile(source, destination)
         media_type, _encoding = mimetypes.guess_type(source.name)
         assets.append(
             ReferenceAsset(
@@ -7,6 +7,7 @@ import json
 import re
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from math_to_manim.agents import (
     CurriculumAgent,
@@ -219,7 +220,9 @@ class AnimationPipeline:
     def _create_run_dir(self, prompt: str) -> Path:
         slug = re.sub(r"[^a-zA-Z0-9]+", "-", prompt.lower()).strip("-")[:48] or "animation"
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        run_dir = self.config.runs_dir / f"{timestamp}-{slug}"
+        # The suffix keeps runs of the same prompt within one second apart,
+        # e.g. concurrent eval cases.
+        run_dir = self.config.runs_dir / f"{timestamp}-{slug}-{uuid4().hex[:8]}"
         run_dir.mkdir(parents=True, exist_ok=False)
         return run_dir
 
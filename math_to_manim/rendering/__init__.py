@@ -2,15 +2,18 @@
 
 from .commands import ToolResult, resolve_binary
 from .ffmpeg import VideoProbe, extract_frame, make_contact_sheet, probe_video
-from .manim import QUALITY_FLAGS, render_manim_scene
+from .manim import OUTPUT_TAIL_BYTES, QUALITY_FLAGS, RenderJob, render_manim_scene, render_manim_scenes
 
 __all__ = [
+    "OUTPUT_TAIL_BYTES",
     "QUALITY_FLAGS",
+    "RenderJob",
     "ToolResult",
     "VideoProbe",
     "extract_frame",
     "make_contact_sheet",
     "probe_video",
     "render_manim_scene",
+    "render_manim_scenes",
     "resolve_binary",
 ]
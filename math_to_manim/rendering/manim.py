@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
 import os
 from pathlib import Path
 import shlex
 import subprocess
 import sys
+import tempfile
+from typing import IO
 
 from .commands import ToolResult, resolve_binary
 
@@ -26,11 +31,15 @@ QUALITY_FLAGS = {
     "4k": "-qk",
 }
 
+# Only the end of Manim's output is useful for diagnosing a failure.
+OUTPUT_TAIL_BYTES = 64 * 1024
+
 
 def render_manim_scene(
     source_path: str | Path,
     *,
     scene_name: str | None = None,
+    scene_names: Sequence[str] = (),
     output_dir: str | Path | None = None,
     quality: str = "low",
     manim_bin: str = "manim",
@@ -42,14 +51,21 @@ def render_manim_scene(
     """Render a Manim scene with the local CLI if it is installed.
 
     Missing Manim is reported as a skipped result instead of an exception.
+    Output goes to temporary files rather than pipes, and only the last
+    ``OUTPUT_TAIL_BYTES`` of each stream are kept; stdout, mostly progress
+    logging, is only read back when the render fails.
+
+    Extra ``scene_names`` from the same file are rendered by the same Manim
+    process, so interpreter and import startup is paid once; with an
+    ``output_dir``, ``metadata["scene_videos"]`` maps each name to its video.
     """
 
     source = Path(source_path).resolve()
     flag = _quality_flag(quality)
     command_prefix = _resolve_manim_command(manim_bin=manim_bin, manim_command=manim_command)
     command = [*command_prefix, flag, str(source)]
-    if scene_name:
-        command.append(scene_name)
+    names = list(dict.fromkeys(name for name in (scene_name, *scene_names) if name))
+    command.extend(names)
     if output_dir is not None:
         media_dir = Path(output_dir).resolve()
         media_dir.mkdir(parents=True, exist_ok=True)
@@ -63,37 +79,122 @@ def render_manim_scene(
     if not source.exists():
         return ToolResult(False, True, tuple(command), reason=f"Scene source not found: {source}")
 
-    try:
-        completed = subprocess.run(
-            command,
-            cwd=str(working_dir) if working_dir is not None else None,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-            check=False,
-        )
-    except subprocess.TimeoutExpired as exc:
-        return ToolResult(
-            False,
-            False,
-            tuple(command),
-            stdout=exc.stdout or "",
-            stderr=exc.stderr or "",
-            reason=f"Timed out after {timeout_seconds} seconds",
-        )
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        try:
+            completed = subprocess.run(
+                command,
+                cwd=str(working_dir) if working_dir is not None else None,
+                stdout=out,
+                stderr=err,
+                timeout=timeout_seconds,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            return ToolResult(
+                False,
+                False,
+                tuple(command),
+                stdout=_read_tail(out),
+                stderr=_read_tail(err),
+                reason=f"Timed out after {timeout_seconds} seconds",
+            )
+        stdout = _read_tail(out) if completed.returncode != 0 else ""
+        stderr = _read_tail(err)
 
-    output_path = _discover_rendered_video(Path(output_dir) if output_dir is not None else None)
+    videos = _scan_videos(Path(output_dir) if output_dir is not None else None)
+    output_path = _newest(videos)
+    metadata = {}
+    if len(names) > 1:
+        metadata["scene_videos"] = {
+            name: str(path)
+            for name in names
+            if (path := _newest([video for video in videos if video[0].stem == name])) is not None
+        }
     return ToolResult(
         completed.returncode == 0,
         False,
         tuple(command),
         returncode=completed.returncode,
-        stdout=completed.stdout,
-        stderr=completed.stderr,
+        stdout=stdout,
+        stderr=stderr,
         output_path=output_path,
+        metadata=metadata,
     )
 
 
+@dataclass(frozen=True)
+class RenderJob:
+    """One scene to render in a batch."""
+
+    source_path: str | Path
+    scene_name: str | None = None
+    output_dir: str | Path | None = None
+    scene_names: tuple[str, ...] = ()
+
+
+def render_manim_scenes(
+    jobs: Sequence[RenderJob],
+    *,
+    max_workers: int | None = None,
+    quality: str = "low",
+    manim_bin: str = "manim",
+    manim_command: Sequence[str] | str | None = None,
+    timeout_seconds: float = 120.0,
+    working_dir: str | Path | None = None,
+    dry_run: bool = False,
+) -> tuple[ToolResult, ...]:
+    """Render several scenes concurrently, returning results in job order.
+
+    Each job runs in its own Manim process, so threads are enough to keep
+    them in flight. Workers default to half the CPU count to leave headroom
+    for Manim's own threads. Give jobs distinct ``output_dir`` values; the
+    rendered video is located by scanning that directory. Jobs with the
+    same source contents, scenes and output directory are rendered once
+    and share the result.
+    """
+
+    if not jobs:
+        return ()
+    keys = [_job_key(job) for job in jobs]
+    unique: dict[tuple[object, ...], RenderJob] = {}
+    for key, job in zip(keys, jobs):
+        unique.setdefault(key, job)
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_workers = max(1, min(max_workers, len(unique)))
+
+    def render(job: RenderJob) -> ToolResult:
+        return render_manim_scene(
+            job.source_path,
+            scene_name=job.scene_name,
+            scene_names=job.scene_names,
+            output_dir=job.output_dir,
+            quality=quality,
+            manim_bin=manim_bin,
+            manim_command=manim_command,
+            timeout_seconds=timeout_seconds,
+            working_dir=working_dir,
+            dry_run=dry_run,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="manim-render") as pool:
+        results = dict(zip(unique, pool.map(render, unique.values())))
+    return tuple(results[key] for key in keys)
+
+
+def _job_key(job: RenderJob) -> tuple[object, ...]:
+    source = Path(job.source_path)
+    try:
+        fingerprint: object = hashlib.blake2b(source.read_bytes(), digest_size=16).digest()
+    except OSError:
+        fingerprint = str(source.resolve())
+    names = tuple(dict.fromkeys(name for name in (job.scene_name, *job.scene_names) if name))
+    output_dir = str(Path(job.output_dir).resolve()) if job.output_dir is not None else None
+    # Manim lays out media/videos/<stem>/..., so equal sources under different
+    # file names still produce different outputs.
+    return (fingerprint, source.stem, names, output_dir)
+
+
 def _quality_flag(quality: str) -> str:
     if quality.startswith("-q"):
         return quality
@@ -104,13 +205,32 @@ def _quality_flag(quality: str) -> str:
         raise ValueError(f"Unknown Manim quality '{quality}'. Valid values: {valid}") from exc
 
 
-def _discover_rendered_video(media_dir: Path | None) -> Path | None:
-    if media_dir is None or not media_dir.exists():
-        return None
-    videos = [path for path in media_dir.rglob("*.mp4") if path.is_file()]
-    if not videos:
-        return None
-    return max(videos, key=lambda path: path.stat().st_mtime)
+def _read_tail(handle: IO[bytes]) -> str:
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(max(0, size - OUTPUT_TAIL_BYTES))
+    return handle.read().decode("utf-8", errors="replace")
+
+
+def _scan_videos(media_dir: Path | None) -> list[tuple[Path, float]]:
+    """Return every .mp4 under media_dir with its modification time."""
+    if media_dir is None or not media_dir.is_dir():
+        return []
+    # One scandir pass; DirEntry type checks reuse the directory read, so
+    # only the .mp4 files themselves are stat'ed.
+    videos: list[tuple[Path, float]] = []
+    pending = [str(media_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".mp4") and entry.is_file():
+                    videos.append((Path(entry.path), entry.stat().st_mtime))
+    return videos
+
+
+def _newest(videos: list[tuple[Path, float]]) -> Path | None:
+    return max(videos, key=lambda video: video[1])[0] if videos else None
 
 
 def _resolve_manim_command(*, manim_bin: str, manim_command: Sequence[str] | str | None) -> tuple[str, ...]:
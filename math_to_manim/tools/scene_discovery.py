@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -39,10 +40,16 @@ def discover_scene_classes(
     base_class_names: tuple[str, ...] = DEFAULT_SCENE_BASES,
     require_construct: bool = False,
     match_scene_suffix: bool = True,
+    tree: ast.Module | None = None,
 ) -> tuple[SceneClass, ...]:
-    """Discover likely Manim scene classes from Python source without imports."""
+    """Discover likely Manim scene classes from Python source without imports.
 
-    tree = ast.parse(source, filename=filename)
+    Pass ``tree`` when the source has already been parsed (for example the
+    ``tree`` of a :func:`validate_python_source` result) to skip re-parsing.
+    """
+
+    if tree is None:
+        tree = ast.parse(source, filename=filename)
     scenes: list[SceneClass] = []
     for node in tree.body:
         if not isinstance(node, ast.ClassDef):
@@ -75,12 +82,38 @@ def discover_scene_classes_in_file(
     match_scene_suffix: bool = True,
     encoding: str = "utf-8",
 ) -> tuple[SceneClass, ...]:
-    """Read a Python file and discover likely Manim scene classes."""
+    """Read a Python file and discover likely Manim scene classes.
+
+    Parses are cached by file contents, so rescanning an unchanged file
+    costs a read but not another ``ast.parse``. Files that never mention a
+    scene base name cannot define a scene and are skipped before decoding.
+    """
 
     source_path = Path(path)
+    data = source_path.read_bytes()
+    needles = (*base_class_names, "Scene") if match_scene_suffix else base_class_names
+    if not any(name.encode(encoding) in data for name in needles):
+        return ()
+    return _discover_cached(
+        data.decode(encoding),
+        str(source_path),
+        base_class_names,
+        require_construct,
+        match_scene_suffix,
+    )
+
+
+@lru_cache(maxsize=256)
+def _discover_cached(
+    source: str,
+    filename: str,
+    base_class_names: tuple[str, ...],
+    require_construct: bool,
+    match_scene_suffix: bool,
+) -> tuple[SceneClass, ...]:
     return discover_scene_classes(
-        source_path.read_text(encoding=encoding),
-        filename=str(source_path),
+        source,
+        filename=filename,
         base_class_names=base_class_names,
         require_construct=require_construct,
         match_scene_suffix=match_scene_suffix,
@@ -90,10 +123,10 @@ def discover_scene_classes_in_file(
 def find_primary_scene_class(source: str, *, filename: str = "<generated>") -> SceneClass | None:
     """Return the first construct-bearing scene class, falling back to the first scene."""
 
-    with_construct = discover_scene_classes(source, filename=filename, require_construct=True)
+    scenes = discover_scene_classes(source, filename=filename)
+    with_construct = [scene for scene in scenes if scene.has_construct]
     if with_construct:
         return with_construct[0]
-    scenes = discover_scene_classes(source, filename=filename)
     return scenes[0] if scenes else None
 
 
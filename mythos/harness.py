@@ -40,6 +40,7 @@ from math_to_manim.providers.mythos_cli import (  # noqa: E402
     _extract_json_object,
     _resolve_command,
 )
+from math_to_manim.tools import find_primary_scene_class  # noqa: E402
 
 # Charter search order: user-local Claude Code dir first, then the tracked
 # canonical copies that ship with the repo (.claude/ is gitignored here).
@@ -306,10 +307,18 @@ def _extract_python_block(text: str) -> str:
 
 
 def _find_scene_class(code: str) -> str:
-    match = re.search(r"class\s+(\w+)\s*\(\s*(?:ThreeDScene|MovingCameraScene|Scene)\b", code)
-    if not match:
+    try:
+        scene = find_primary_scene_class(code, filename="mythos_scene.py")
+    except SyntaxError:
+        # Unparseable code still needs a class name so _verify can report
+        # the error and the repair loop can run.
+        match = re.search(r"^class\s+(\w+)\s*\([^)]*Scene\b", code, flags=re.MULTILINE)
+        scene_name = match.group(1) if match else None
+    else:
+        scene_name = scene.name if scene is not None else None
+    if scene_name is None:
         raise RuntimeError("Generated code defines no Scene subclass")
-    return match.group(1)
+    return scene_name
 
 
 def _offline_artifact(slug: str, prompt: str, prior: dict) -> dict:
@@ -48,6 +48,37 @@ def test_prompt_suite_runner_reports_missing_acceptance_terms(tmp_path) -> None:
     assert "not in this run" in failed[0].message
 
 
+def test_prompt_suite_runner_runs_cases_concurrently_in_suite_order(tmp_path) -> None:
+    suite_path = tmp_path / "suite.yaml"
+    suite_path.write_text(
+        """suite_id: "parallel_suite"
+cases:
+  - id: "derivative_case"
+    input:
+      prompt: "Explain why derivatives are slopes."
+  - id: "integral_case"
+    input:
+      prompt: "Explain why integrals are areas."
+  - id: "limit_case"
+    input:
+      prompt: "Explain what a limit is."
+""",
+        encoding="utf-8",
+    )
+
+    result = run_prompt_suite(
+        suite_path,
+        config=RuntimeConfig(deterministic=True, trace_enabled=False),
+        runs_dir=tmp_path / "runs",
+        render=False,
+        max_workers=3,
+    )
+
+    assert [case.case_id for case in result.cases] == ["derivative_case", "integral_case", "limit_case"]
+    assert result.passed_count == 3
+    assert len({case.run_dir for case in result.cases}) == 3
+
+
 def test_eval_suite_cli_outputs_json(tmp_path, capsys) -> None:
     suite_path = _write_suite(tmp_path, acceptance_terms=["derivatives"])
 
@@ -108,3 +108,13 @@ def test_pipeline_copies_reference_images_into_run_bundle(tmp_path) -> None:
     assert package.reference_assets is not None
     assert package.reference_assets.assets[0].sha256 == digest
     assert "reference_assets" in manifest["artifacts"]
+
+
+def test_pipeline_gives_same_prompt_runs_distinct_run_dirs(tmp_path) -> None:
+    pipeline = AnimationPipeline(RuntimeConfig(runs_dir=tmp_path, deterministic=True))
+
+    first = pipeline._create_run_dir("Explain why derivatives are slopes")
+    second = pipeline._create_run_dir("Explain why derivatives are slopes")
+
+    assert first != second
+    assert first.is_dir() and second.is_dir()
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import ast
 import json
 import subprocess
 import sys
+import threading
+import time
 
 import pytest
 
-from math_to_manim.rendering import extract_frame, make_contact_sheet, probe_video, render_manim_scene
+from math_to_manim.rendering import (
+    OUTPUT_TAIL_BYTES,
+    RenderJob,
+    extract_frame,
+    make_contact_sheet,
+    probe_video,
+    render_manim_scene,
+    render_manim_scenes,
+)
 from math_to_manim.review import (
     EvalCriterion,
     build_eval_prompt,
@@ -18,6 +29,7 @@ from math_to_manim.tools import (
     ArtifactStore,
     GraphCycleError,
     discover_scene_classes,
+    discover_scene_classes_in_file,
     find_primary_scene_class,
     normalize_graph,
     topological_sort,
@@ -89,10 +101,37 @@ class CameraMove(manim.ThreeDScene):
 
     assert [scene.name for scene in scenes] == ["Opening", "CameraMove"]
     assert scenes[0].has_construct is True
+    assert discover_scene_classes("", tree=ast.parse(source)) == scenes
     assert scenes[1].bases == ("manim.ThreeDScene",)
     assert find_primary_scene_class(source).name == "Opening"
 
 
+def test_scene_discovery_in_file_reuses_parse_until_contents_change(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    scene_file = tmp_path / "scene.py"
+    scene_file.write_text("class Opening(Scene):\n    pass\n", encoding="utf-8")
+    parses: list[str] = []
+    original_parse = ast.parse
+
+    def counting_parse(source: str, *args: object, **kwargs: object) -> ast.Module:
+        parses.append(source)
+        return original_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr("math_to_manim.tools.scene_discovery.ast.parse", counting_parse)
+
+    first = discover_scene_classes_in_file(scene_file)
+    second = discover_scene_classes_in_file(scene_file)
+    scene_file.write_text("class Closing(Scene):\n    pass\n", encoding="utf-8")
+    third = discover_scene_classes_in_file(scene_file)
+
+    helper_file = tmp_path / "helpers.py"
+    helper_file.write_text("def ease(t):\n    return t * t\n", encoding="utf-8")
+
+    assert first is second
+    assert [scene.name for scene in third] == ["Closing"]
+    assert discover_scene_classes_in_file(helper_file) == ()
+    assert len(parses) == 2
+
+
 def test_optional_rendering_wrappers_skip_missing_binaries(tmp_path) -> None:
     scene_file = tmp_path / "scene.py"
     scene_file.write_text("from manim import Scene\n", encoding="utf-8")
@@ -142,10 +181,124 @@ def test_render_manim_scene_falls_back_to_python_module(monkeypatch: pytest.Monk
     result = render_manim_scene(scene_file, scene_name="DemoScene", output_dir=media_dir)
 
     assert result.ok
+    assert result.output_path == media_dir / "videos" / "scene" / "1080p30" / "DemoScene.mp4"
     assert result.command[:3] == (sys.executable, "-m", "manim")
     assert calls[0][:3] == [sys.executable, "-m", "manim"]
 
 
+def test_render_manim_scene_renders_several_scenes_in_one_process(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    scene_file = tmp_path / "scene.py"
+    scene_file.write_text("from manim import Scene\nclass One(Scene):\n    pass\nclass Two(Scene):\n    pass\n", encoding="utf-8")
+    media_dir = tmp_path / "media"
+    calls: list[list[str]] = []
+
+    def fake_run(command: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(command)
+        video_dir = media_dir / "videos" / "scene" / "480p15"
+        video_dir.mkdir(parents=True)
+        for name in ("One", "Two"):
+            (video_dir / f"{name}.mp4").write_bytes(b"video")
+        kwargs["stdout"].write(b"Animation 0: progress")
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr("math_to_manim.rendering.manim.resolve_binary", lambda binary: binary)
+    monkeypatch.setattr("math_to_manim.rendering.manim.subprocess.run", fake_run)
+
+    result = render_manim_scene(scene_file, scene_name="One", scene_names=["Two", "One"], output_dir=media_dir)
+
+    assert len(calls) == 1
+    assert calls[0][3:5] == ["One", "Two"]
+    assert result.ok
+    assert result.stdout == ""
+    video_dir = media_dir / "videos" / "scene" / "480p15"
+    assert result.metadata["scene_videos"] == {"One": str(video_dir / "One.mp4"), "Two": str(video_dir / "Two.mp4")}
+
+
+def test_render_manim_scene_keeps_only_the_output_tail(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    scene_file = tmp_path / "scene.py"
+    scene_file.write_text("from manim import Scene\nclass DemoScene(Scene):\n    pass\n", encoding="utf-8")
+
+    def fake_run(command: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        kwargs["stdout"].write(b"x" * (OUTPUT_TAIL_BYTES * 2) + b"done")
+        kwargs["stderr"].write(b"Traceback: boom")
+        return subprocess.CompletedProcess(command, 1)
+
+    monkeypatch.setattr("math_to_manim.rendering.manim.resolve_binary", lambda binary: binary)
+    monkeypatch.setattr("math_to_manim.rendering.manim.subprocess.run", fake_run)
+
+    result = render_manim_scene(scene_file, scene_name="DemoScene")
+
+    assert not result.ok
+    assert len(result.stdout) == OUTPUT_TAIL_BYTES
+    assert result.stdout.endswith("done")
+    assert result.stderr == "Traceback: boom"
+
+
+def test_render_manim_scenes_runs_jobs_concurrently_in_order(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    jobs = []
+    for name in ("AScene", "BScene", "CScene"):
+        scene_file = tmp_path / f"{name}.py"
+        scene_file.write_text(f"from manim import Scene\nclass {name}(Scene):\n    pass\n", encoding="utf-8")
+        jobs.append(RenderJob(scene_file, scene_name=name, output_dir=tmp_path / name / "media"))
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def fake_run(command: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        kwargs["stderr"].write(command[-3].encode())
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr("math_to_manim.rendering.manim.resolve_binary", lambda binary: binary)
+    monkeypatch.setattr("math_to_manim.rendering.manim.subprocess.run", fake_run)
+
+    results = render_manim_scenes(jobs, max_workers=3)
+
+    assert [result.stderr for result in results] == ["AScene", "BScene", "CScene"]
+    assert all(result.ok for result in results)
+    assert peak > 1
+    assert render_manim_scenes([]) == ()
+
+
+def test_render_manim_scenes_renders_duplicate_sources_once(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    source = "from manim import Scene\nclass DemoScene(Scene):\n    pass\n"
+    first = tmp_path / "a" / "scene.py"
+    copy = tmp_path / "b" / "scene.py"
+    renamed = tmp_path / "c" / "renamed.py"
+    for path in (first, copy, renamed):
+        path.parent.mkdir()
+        path.write_text(source, encoding="utf-8")
+    media_dir = tmp_path / "media"
+    calls: list[list[str]] = []
+
+    def fake_run(command: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(command)
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr("math_to_manim.rendering.manim.resolve_binary", lambda binary: binary)
+    monkeypatch.setattr("math_to_manim.rendering.manim.subprocess.run", fake_run)
+
+    results = render_manim_scenes(
+        [
+            RenderJob(first, scene_name="DemoScene", output_dir=media_dir),
+            RenderJob(copy, scene_name="DemoScene", output_dir=media_dir),
+            RenderJob(first, scene_name="DemoScene", output_dir=tmp_path / "other"),
+            RenderJob(renamed, scene_name="DemoScene", output_dir=media_dir),
+        ]
+    )
+
+    assert len(calls) == 3
+    assert results[0] is results[1]
+    assert results[2] is not results[0]
+    assert results[3] is not results[0]
+
+
 def test_video_scoring_is_weighted_and_deterministic() -> None:
     good = score_video_metadata(duration_seconds=2.0, width=1280, height=720, file_size_bytes=10)
     weak = score_video_metadata(duration_seconds=0.25, width=320, height=180, file_size_bytes=0)